@@ -6,30 +6,93 @@ This script demonstrates the complete workflow:
 1. Upload a 3D model
 2. Create a custom profile
 3. Submit a slicing job with overrides
-4. Poll for completion
-5. Download results
+4. Wait for completion (event stream, falling back to polling)
+5. Download results (concurrently)
+
+Usage: python example_usage.py [MODEL_FILE] [--no-metadata]
 """
 
+import asyncio
+import random
 import time
 import sys
 from pathlib import Path
 
+import httpx
+
 # Add src to path for local development
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.clients.python_client import OrcaSlicerClient, ApiError
+from src.clients.python_client import OrcaSlicerClient, AsyncOrcaSlicerClient, ApiError
+
+
+def poll_slice_job(client: OrcaSlicerClient, job_id: str, timeout: float = 120.0) -> dict:
+    """Poll a slice job until it finishes or the timeout expires.
+
+    Uses server-side long polling where available; against servers that
+    answer immediately it polls quickly while the job is fresh, backs off
+    exponentially while nothing changes, and snaps back on progress.
+    """
+    deadline = time.monotonic() + timeout
+    min_interval = 0.25
+    max_interval = 4.0
+    interval = min_interval
+    last_state = None
+    job = {"status": "unknown"}
+
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        try:
+            # Long poll: the server answers as soon as the job changes
+            wait = max(1, min(25, int(deadline - started)))
+            job = client.get_slice_job_status(job_id, wait=wait)
+        except ApiError as e:
+            if e.retry_after is not None:
+                # Rate limited: wait as long as the server asked, then keep
+                # polling at least that slowly
+                interval = min(max(interval, e.retry_after), max_interval)
+                time.sleep(min(e.retry_after, max(0.0, deadline - time.monotonic())))
+                continue
+            print(f"   ⚠️  Failed to get job status: {e.message}")
+            interval = min(interval * 2, max_interval)
+            time.sleep(interval * random.uniform(0.8, 1.2))
+            continue
+
+        status = job["status"]
+        if status in ("completed", "failed"):
+            # Only the finished job needs the full resource with outputs
+            return client.get_slice_job(job_id)
+
+        progress = job.get("progress_percent") or 0
+        print(f"   Status: {status} ({progress}%)", end="\r")
+
+        if (status, progress) != last_state:
+            interval = min_interval
+            last_state = (status, progress)
+        else:
+            interval = min(interval * 2, max_interval)
+
+        # Time the server spent holding the long poll counts toward the wait
+        elapsed = time.monotonic() - started
+        time.sleep(max(0.0, interval * random.uniform(0.8, 1.2) - elapsed))
+
+    return job
 
 
-def main():
+def main(model_file: str = "example.stl", show_metadata: bool = True):
     """Run example workflow."""
-    # Initialize client
-    client = OrcaSlicerClient(base_url="http://localhost:8000", timeout=30.0)
+    # One client for the whole workflow, so every step reuses the same
+    # keep-alive connections
+    with OrcaSlicerClient(base_url="http://localhost:8000", timeout=30.0) as client:
+        run_workflow(client, model_file, show_metadata)
 
+
+def run_workflow(client: OrcaSlicerClient, model_file: str, show_metadata: bool = True):
+    """Upload, slice, and download using an open client."""
     print("🚀 OrcaSlicer API Example Workflow\n")
 
     # Step 1: Upload a model
     print("📤 Step 1: Upload model")
-    model_file = "example.stl"  # Replace with your actual model file
 
     if not Path(model_file).exists():
         print(f"⚠️  Model file '{model_file}' not found.")
@@ -97,64 +160,69 @@ def main():
         print(f"   ✗ Job creation failed: {e.message}")
         return
 
-    # Step 4: Poll for completion
+    # Step 4: Wait for completion
     print("⏳ Step 4: Wait for slicing to complete")
     job_id = job["id"]
-    max_attempts = 60  # 2 minutes with 2-second intervals
-    attempt = 0
 
-    while attempt < max_attempts:
-        try:
-            job = client.get_slice_job(job_id)
-            status = job["status"]
-
-            if status == "completed":
-                print(f"   ✓ Slicing completed!")
-                duration = (
-                    job["finished_at"]
-                    if job.get("finished_at")
-                    else "unknown"
-                )
-                print(f"   Duration: {duration}\n")
-                break
-            elif status == "failed":
-                print(f"   ✗ Slicing failed!")
-                print(f"   Error: {job.get('error_message', 'Unknown error')}\n")
-                return
-            else:
-                progress = job.get("progress_percent", 0)
-                print(f"   Status: {status} ({progress}%)", end="\r")
-                time.sleep(2)
-                attempt += 1
-        except ApiError as e:
-            print(f"   ✗ Failed to get job status: {e.message}")
-            return
+    try:
+        # One long-lived event stream instead of repeated status requests
+        for event in client.stream_slice_job_events(job_id):
+            progress = event.get("progress_percent") or 0
+            print(f"   Status: {event['status']} ({progress}%)", end="\r")
+        job = client.get_slice_job(job_id)
+    except (ApiError, httpx.HTTPError) as e:
+        print(f"   ⚠️  Event stream unavailable ({e}), falling back to polling")
+        job = poll_slice_job(client, job_id)
 
-    if job["status"] != "completed":
+    if job["status"] == "completed":
+        print(f"   ✓ Slicing completed!")
+        duration = (
+            job["finished_at"]
+            if job.get("finished_at")
+            else "unknown"
+        )
+        print(f"   Duration: {duration}\n")
+    elif job["status"] == "failed":
+        print(f"   ✗ Slicing failed!")
+        print(f"   Error: {job.get('error_message', 'Unknown error')}\n")
+        return
+    else:
         print("\n   ⚠️  Job did not complete in time")
         return
 
     # Step 5: Download results
     print("📥 Step 5: Download results")
 
-    # Download G-code
-    try:
-        gcode_file = f"{job_id}_output.gcode"
-        client.download_gcode(job_id, gcode_file)
+    # Download G-code and 3MF project concurrently
+    gcode_file = f"{job_id}_output.gcode"
+    project_file = f"{job_id}_project.3mf"
+
+    async def download_outputs():
+        async with AsyncOrcaSlicerClient(base_url=client.base_url, timeout=client.timeout) as aclient:
+            return await asyncio.gather(
+                aclient.download_gcode(job_id, gcode_file),
+                aclient.download_project_3mf(job_id, project_file),
+                return_exceptions=True,
+            )
+
+    gcode_result, project_result = asyncio.run(download_outputs())
+
+    if isinstance(gcode_result, ApiError):
+        print(f"   ✗ Failed to download G-code: {gcode_result.message}")
+    elif isinstance(gcode_result, Exception):
+        raise gcode_result
+    else:
         print(f"   ✓ G-code saved: {gcode_file}")
-    except ApiError as e:
-        print(f"   ✗ Failed to download G-code: {e.message}")
 
-    # Download 3MF project
-    try:
-        project_file = f"{job_id}_project.3mf"
-        client.download_project_3mf(job_id, project_file)
+    if isinstance(project_result, ApiError):
+        print(f"   ✗ Failed to download 3MF: {project_result.message}")
+    elif isinstance(project_result, Exception):
+        raise project_result
+    else:
         print(f"   ✓ 3MF project saved: {project_file}")
-    except ApiError as e:
-        print(f"   ✗ Failed to download 3MF: {e.message}")
 
     # Display metadata
-    if job.get("output") and job["output"].get("metadata"):
+    if show_metadata and job.get("output") and job["output"].get("metadata"):
         metadata = job["output"]["metadata"]
         print(f"\n📊 Print Metadata:")
 
@@ -195,8 +263,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # Usage: python example_usage.py [MODEL_FILE] [--no-metadata]
+    args = [a for a in sys.argv[1:] if a != "--no-metadata"]
     try:
-        main()
+        main(args[0] if args else "example.stl", "--no-metadata" not in sys.argv)
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
         sys.exit(1)
@@ -1,14 +1,17 @@
 """Health check routes."""
 
-import subprocess
+import asyncio
 import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
-from ..models.db_models import Profile
+from ..models.db_models import Model, Profile, SliceJob, SliceJobStatus
 from ..models.schemas import HealthResponse
+from ..core.cache import TTLCache
 from ..core.config import settings
 
 
@@ -16,6 +19,92 @@ router = APIRouter(tags=["health"])
 
 start_time = time.time()
 
+# How long a probed OrcaSlicer version stays valid
+VERSION_CACHE_TTL_SECONDS = 60
+
+# How long aggregate DB metrics are reused between probes
+METRICS_CACHE_TTL_SECONDS = 10
+
+# Settings are fixed after startup, so resolve the CLI path once
+_ORCA_PATH = Path(settings.orca_cli_path)
+
+
+@dataclass
+class _VersionCache:
+    """Last OrcaSlicer CLI probe result."""
+
+    ts: Optional[float] = None
+    available: bool = False
+    version: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        """Check whether the probe result is still within its TTL."""
+        return self.ts is not None and time.monotonic() - self.ts < VERSION_CACHE_TTL_SECONDS
+
+
+_version_cache = _VersionCache()
+_version_lock = asyncio.Lock()
+
+
+async def _probe_orca_version() -> _VersionCache:
+    """Return the cached OrcaSlicer availability and version, re-probing when stale."""
+    if _version_cache.is_fresh():
+        return _version_cache
+
+    async with _version_lock:
+        # Another probe may have refreshed the cache while we waited
+        if _version_cache.is_fresh():
+            return _version_cache
+
+        available = _ORCA_PATH.exists()
+        version = None
+
+        if available:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    str(_ORCA_PATH),
+                    "--version",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), 5)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise
+                if process.returncode == 0:
+                    version = stdout.decode().strip()
+            except Exception:
+                pass
+
+        _version_cache.ts = time.monotonic()
+        _version_cache.available = available
+        _version_cache.version = version
+        return _version_cache
+
+
+_metrics_cache = TTLCache(maxsize=1, ttl=METRICS_CACHE_TTL_SECONDS)
+
+# All health metrics in one round-trip, as scalar subqueries
+_METRICS_QUERY = select(
+    select(func.count(Profile.id)).scalar_subquery().label("profiles"),
+    select(func.count(Model.id)).scalar_subquery().label("models"),
+    select(func.count(SliceJob.id))
+    .where(SliceJob.status.in_([SliceJobStatus.QUEUED, SliceJobStatus.RUNNING]))
+    .scalar_subquery()
+    .label("active_jobs"),
+)
+
+
+async def _db_metrics(db: AsyncSession) -> Row:
+    """Return (profiles, models, active_jobs) counts, cached for a short TTL."""
+    metrics = _metrics_cache.get("metrics")
+    if metrics is None:
+        metrics = (await db.execute(_METRICS_QUERY)).one()
+        _metrics_cache.set("metrics", metrics)
+    return metrics
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check(db: AsyncSession = Depends(get_db)):
@@ -24,35 +113,21 @@ async def health_check(db: AsyncSession = Depends(get_db)):
 
     Returns service status, OrcaSlicer availability, and other metrics.
     """
-    # Check OrcaSlicer CLI
-    orca_available = Path(settings.orca_cli_path).exists()
-    orca_version = None
-
-    if orca_available:
-        try:
-            # Try to get version
-            result = subprocess.run(
-                [settings.orca_cli_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                orca_version = result.stdout.strip()
-        except Exception:
-            pass
-
-    # Count profiles
-    count_result = await db.execute(select(func.count(Profile.id)))
-    profiles_count = count_result.scalar_one()
+    # Check OrcaSlicer CLI (cached, re-probed at most once per TTL)
+    orca = await _probe_orca_version()
+
+    # Database metrics (one query, cached)
+    metrics = await _db_metrics(db)
 
     # Calculate uptime
     uptime_seconds = int(time.time() - start_time)
 
     return HealthResponse(
         status="ok",
-        orca_cli_available=orca_available,
-        orca_version=orca_version,
-        profiles_loaded=profiles_count,
+        orca_cli_available=orca.available,
+        orca_version=orca.version,
+        profiles_loaded=metrics.profiles,
+        models_stored=metrics.models,
+        active_jobs=metrics.active_jobs,
         uptime_seconds=uptime_seconds,
     )
@@ -1,18 +1,22 @@
 """Model upload and management routes."""
 
-from fastapi import APIRouter, UploadFile, File, Depends, Query
+from typing import Optional
+from fastapi import APIRouter, UploadFile, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
 from ..models.schemas import ModelResponse, ModelListResponse
 from ..services.models_service import models_service
+from ..core.http import make_etag, etag_matches, not_modified
+from ..core.pagination import set_next_link
+from ..core.uploads import MODEL_UPLOAD_OPENAPI, model_upload
 
 
 router = APIRouter(prefix="/models", tags=["models"])
 
 
-@router.post("", response_model=ModelResponse, status_code=201)
+@router.post("", response_model=ModelResponse, status_code=201, openapi_extra=MODEL_UPLOAD_OPENAPI)
 async def upload_model(
-    file: UploadFile = File(...),
+    file: UploadFile = Depends(model_upload),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -30,18 +34,57 @@ async def upload_model(
 
 @router.get("", response_model=ModelListResponse)
 async def list_models(
+    request: Request,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    exact: bool = Query(False, description="Count the total exactly instead of estimating it"),
     db: AsyncSession = Depends(get_db),
 ):
-    """List uploaded models."""
-    return await models_service.list_models(db=db, limit=limit, offset=offset)
+    """
+    List uploaded models.
+
+    When more results may follow, the response carries ``next_cursor`` and a
+    ``Link: <...>; rel="next"`` header. Supports conditional requests via
+    ETag / If-None-Match.
+    """
+    models = await models_service.list_models(
+        db=db, limit=limit, offset=offset, cursor=cursor, exact=exact
+    )
+
+    # Models are immutable, so their IDs identify the page contents
+    etag = make_etag(models.total, models.next_cursor, *(m.id for m in models.items))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # Serialize the validated page directly instead of letting FastAPI
+    # re-validate every item against the response model
+    response = Response(
+        content=models.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+    set_next_link(request, response, models.next_cursor)
+    return response
 
 
 @router.get("/{model_id}", response_model=ModelResponse)
 async def get_model(
     model_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get model details by ID."""
-    return await models_service.get_model(db=db, model_id=model_id)
+    """
+    Get model details by ID.
+
+    Supports conditional requests via ETag / If-None-Match.
+    """
+    model = await models_service.get_model(db=db, model_id=model_id)
+
+    etag = make_etag(model.id, model.uploaded_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+    return model
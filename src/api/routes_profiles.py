@@ -1,21 +1,29 @@
 """Profile management routes."""
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
 from ..models.schemas import (
     ProfileCreate,
+    ProfileBatchCreate,
+    ProfileBatchResponse,
     ProfileUpdate,
     ProfileResponse,
     ProfileListResponse,
     ProfileDeleteResponse,
 )
 from ..services.profiles_service import profiles_service
+from ..core.http import make_etag, etag_matches, not_modified
+from ..core.pagination import set_next_link
 
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
+# Builtin profiles only change on redeploy, so their listing may be reused
+# briefly; other listings must be revalidated with their ETag
+BUILTIN_LIST_CACHE_CONTROL = "max-age=30, stale-while-revalidate=60"
+
 
 @router.post("", response_model=ProfileResponse, status_code=201)
 async def create_profile(
@@ -26,29 +34,83 @@ async def create_profile(
     return await profiles_service.create_profile(db=db, profile_data=profile)
 
 
+@router.post("/batch", response_model=ProfileBatchResponse, status_code=201)
+async def create_profiles(
+    batch: ProfileBatchCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create several slicing profiles at once; all or none are created."""
+    return await profiles_service.create_profiles(db=db, profiles_data=batch.items)
+
+
 @router.get("", response_model=ProfileListResponse)
 async def list_profiles(
+    request: Request,
     source: Optional[str] = Query(None, description="Filter by source: 'builtin' or 'user'"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    exact: bool = Query(False, description="Count the total exactly instead of estimating it"),
     db: AsyncSession = Depends(get_db),
 ):
-    """List slicing profiles."""
-    return await profiles_service.list_profiles(
+    """
+    List slicing profiles.
+
+    When more results may follow, the response carries ``next_cursor`` and a
+    ``Link: <...>; rel="next"`` header. Supports conditional requests via
+    ETag / If-None-Match; builtin listings may also be cached briefly.
+    """
+    profiles = await profiles_service.list_profiles(
         db=db,
         source=source,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        exact=exact,
     )
 
+    etag = make_etag(
+        profiles.total,
+        profiles.next_cursor,
+        *(part for p in profiles.items for part in (p.id, p.updated_at)),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # Serialize the validated page directly instead of letting FastAPI
+    # re-validate every item against the response model
+    response = Response(
+        content=profiles.model_dump_json(),
+        media_type="application/json",
+        headers={
+            "ETag": etag,
+            "Cache-Control": BUILTIN_LIST_CACHE_CONTROL if source == "builtin" else "no-cache",
+        },
+    )
+    set_next_link(request, response, profiles.next_cursor)
+    return response
+
 
 @router.get("/{profile_id}", response_model=ProfileResponse)
 async def get_profile(
     profile_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get profile details by ID."""
-    return await profiles_service.get_profile(db=db, profile_id=profile_id)
+    """
+    Get profile details by ID.
+
+    Supports conditional requests via ETag / If-None-Match.
+    """
+    profile = await profiles_service.get_profile(db=db, profile_id=profile_id)
+
+    etag = make_etag(profile.id, profile.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+    return profile
 
 
 @router.patch("/{profile_id}", response_model=ProfileResponse)
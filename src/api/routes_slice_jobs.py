@@ -1,17 +1,38 @@
 """Slice job routes."""
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import FileResponse
+import asyncio
+import json
+import os
+from pathlib import Path
+import anyio
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..database import get_db
-from ..models.schemas import SliceJobCreate, SliceJobResponse
-from ..services.slice_service import slice_service
+from ..database import get_db, async_session_maker
+from ..models.schemas import SliceJobCreate, SliceJobResponse, SliceJobStatusResponse
+from ..services.slice_service import slice_service, TERMINAL_STATUSES, DISPATCH_POLL_INTERVAL_SECONDS
 from ..services.storage_service import storage_service
+from ..core.config import settings
 from ..core.errors import ApiError
+from ..core.http import make_etag, etag_matches, not_modified, accepts_encoding, prefer_wait
+from ..core.files import file_headers, file_response
+from ..core.ratelimit import rate_limit
 
 
 router = APIRouter(prefix="/slice-jobs", tags=["slice-jobs"])
 
+# Interval between SSE keep-alive comments while a job is idle
+EVENTS_KEEPALIVE_SECONDS = 15
+
+# Outputs of a completed job never change, so clients and CDNs may keep them
+IMMUTABLE_CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+# Upper bound on how long a "Prefer: wait=N" long poll is held open
+MAX_LONG_POLL_SECONDS = 60
+
+# Caps runaway pollers; exceeding it yields 429 with Retry-After
+limit_polling = rate_limit(settings.poll_rate_limit_per_second, settings.poll_rate_limit_burst)
+
 
 @router.post("", response_model=SliceJobResponse, status_code=201)
 async def create_slice_job(
@@ -27,76 +48,308 @@ async def create_slice_job(
     return await slice_service.create_slice_job(db=db, job_data=job)
 
 
-@router.get("/{job_id}", response_model=SliceJobResponse)
+def _job_etag(job) -> str:
+    """ETag for the parts of a job that change while it runs."""
+    return make_etag(job.id, job.status, job.progress_percent, job.finished_at)
+
+
+async def _read_job_long_poll(request: Request, db: AsyncSession, job_id: str, read):
+    """
+    Read a job representation, honoring ``Prefer: wait=N``.
+
+    When the client's ETag is current, the request is held until the job
+    changes or N seconds (at most MAX_LONG_POLL_SECONDS) pass. Changes made
+    in this process wake it at once; the job is also re-read every few
+    seconds, since another process may be running it. Returns (job, etag).
+    """
+    wait = prefer_wait(request)
+    # Subscribe before reading the job so no transition is missed
+    queue = slice_service.subscribe(job_id) if wait else None
+    try:
+        job = await read()
+        etag = _job_etag(job)
+
+        if queue is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + min(wait, MAX_LONG_POLL_SECONDS)
+            while job.status not in TERMINAL_STATUSES and etag_matches(request, etag):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                # Don't pin a DB connection while idle
+                await db.close()
+                try:
+                    await asyncio.wait_for(
+                        queue.get(), min(remaining, DISPATCH_POLL_INTERVAL_SECONDS)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                job = await read()
+                etag = _job_etag(job)
+    finally:
+        if queue is not None:
+            slice_service.unsubscribe(job_id, queue)
+
+    return job, etag
+
+
+@router.get(
+    "/{job_id}",
+    response_model=SliceJobResponse,
+    dependencies=[Depends(limit_polling)],
+)
 async def get_slice_job(
     job_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get slice job status and results."""
-    return await slice_service.get_slice_job(db=db, job_id=job_id)
+    """
+    Get slice job status and results.
 
+    Supports conditional requests via ETag / If-None-Match, so pollers only
+    receive a body when the job status or progress has changed, and long
+    polling via ``Prefer: wait=N``.
+    """
+    job, etag = await _read_job_long_poll(
+        request, db, job_id, lambda: slice_service.get_slice_job(db=db, job_id=job_id)
+    )
 
-@router.get("/{job_id}/gcode")
-async def download_gcode(
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # The service already returns a validated model; serialize it directly
+    # instead of letting FastAPI re-validate and re-encode it on every poll
+    return Response(
+        content=job.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/{job_id}/status",
+    response_model=SliceJobStatusResponse,
+    dependencies=[Depends(limit_polling)],
+)
+async def get_slice_job_status(
     job_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Download G-code output."""
-    job = await slice_service.get_slice_job(db=db, job_id=job_id)
+    """
+    Get only the status and progress of a slice job.
+
+    A small, single-row lookup meant for polling; fetch the full job once
+    the status is terminal. Supports ETags and ``Prefer: wait=N`` like the
+    full resource.
+    """
+    job, etag = await _read_job_long_poll(
+        request, db, job_id, lambda: slice_service.get_job_progress(db=db, job_id=job_id)
+    )
+
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    return Response(
+        content=job.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/{job_id}/events")
+async def stream_slice_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream slice job status transitions as Server-Sent Events.
+
+    The first event carries the current status; the stream closes after the
+    job reaches a terminal status ("completed" or "failed").
+    """
+    # Subscribe before reading the current state so no transition is missed
+    queue = slice_service.subscribe(job_id)
+    try:
+        job = await slice_service.get_slice_job(db=db, job_id=job_id)
+    except Exception:
+        slice_service.unsubscribe(job_id, queue)
+        raise
+
+    # Release the DB connection; the stream is fed by the in-process queue,
+    # falling back to a re-read when it stays quiet (another process may be
+    # running the job)
+    await db.close()
+
+    async def current_event() -> dict:
+        """Read the job's current status as an event."""
+        async with async_session_maker() as session:
+            progress = await slice_service.get_job_progress(session, job_id)
+        return {"id": job_id, "status": progress.status, "progress_percent": progress.progress_percent}
+
+    async def event_stream():
+        try:
+            event = {
+                "id": job.id,
+                "status": job.status,
+                "progress_percent": job.progress_percent,
+            }
+            yield f"data: {json.dumps(event)}\n\n"
+
+            while event["status"] not in TERMINAL_STATUSES:
+                try:
+                    event = await asyncio.wait_for(queue.get(), EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    latest = await current_event()
+                    if latest == event:
+                        yield ": keep-alive\n\n"
+                        continue
+                    event = latest
+                yield f"data: {json.dumps(event)}\n\n"
+        finally:
+            slice_service.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _completed_job_file(
+    db: AsyncSession,
+    job_id: str,
+    filename: str,
+    missing_message: str,
+) -> tuple[Path, os.stat_result]:
+    """Resolve an output file of a completed job, raising structured errors."""
+    job_status = await slice_service.get_job_status(db=db, job_id=job_id)
 
-    if job.status != "completed":
+    if job_status != "completed":
         raise ApiError(
             code="JOB_NOT_COMPLETED",
             message="Job is not completed yet.",
             http_status=400,
-            details={"job_id": job_id, "status": job.status},
+            details={"job_id": job_id, "status": job_status},
         )
 
-    gcode_path = storage_service.get_file_path(job_id, "output.gcode")
+    path = storage_service.get_file_path(job_id, filename)
 
-    if not gcode_path.exists():
+    # A single stat (off the event loop) serves both as the existence check
+    # and as the stat result FileResponse would otherwise fetch again
+    try:
+        stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    except FileNotFoundError:
         raise ApiError(
             code="FILE_NOT_FOUND",
-            message="G-code file not found.",
+            message=missing_message,
             http_status=404,
             details={"job_id": job_id},
         )
 
-    return FileResponse(
-        path=str(gcode_path),
+    return path, stat_result
+
+
+async def _gcode_variant(
+    request: Request,
+    gcode_path: Path,
+    stat_result: os.stat_result,
+) -> tuple[Path, os.stat_result, dict[str, str]]:
+    """Pick the precompressed G-code when the client accepts gzip."""
+    headers = {**IMMUTABLE_CACHE_HEADERS, "Vary": "Accept-Encoding"}
+
+    # Byte ranges always address the identity encoding so resumed and
+    # parallel downloads can be stitched together
+    if accepts_encoding(request, "gzip") and "range" not in request.headers:
+        gz_path = gcode_path.with_name(gcode_path.name + ".gz")
+        try:
+            gz_stat = await anyio.to_thread.run_sync(os.stat, gz_path)
+        except FileNotFoundError:
+            pass
+        else:
+            return gz_path, gz_stat, {**headers, "Content-Encoding": "gzip"}
+
+    return gcode_path, stat_result, headers
+
+
+@router.get("/{job_id}/gcode")
+async def download_gcode(
+    job_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Download G-code output.
+
+    Clients sending ``Accept-Encoding: gzip`` receive the copy compressed at
+    slice time, with ``Content-Encoding: gzip``. Single byte ranges are
+    supported for resumable downloads.
+    """
+    gcode_path, stat_result = await _completed_job_file(
+        db, job_id, "output.gcode", "G-code file not found."
+    )
+    path, stat_result, headers = await _gcode_variant(request, gcode_path, stat_result)
+
+    return file_response(
+        request,
+        str(path),
+        stat_result,
         media_type="application/octet-stream",
         filename=f"{job_id}_output.gcode",
+        headers=headers,
+    )
+
+
+@router.head("/{job_id}/gcode")
+async def head_gcode(
+    job_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """Report G-code availability, size and validators without a body."""
+    gcode_path, stat_result = await _completed_job_file(
+        db, job_id, "output.gcode", "G-code file not found."
+    )
+    _, stat_result, headers = await _gcode_variant(request, gcode_path, stat_result)
+
+    return Response(
+        media_type="application/octet-stream",
+        headers={**headers, **file_headers(stat_result)},
     )
 
 
 @router.get("/{job_id}/project.3mf")
 async def download_project_3mf(
     job_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Download 3MF project file."""
-    job = await slice_service.get_slice_job(db=db, job_id=job_id)
+    """Download 3MF project file. Single byte ranges are supported."""
+    project_path, stat_result = await _completed_job_file(
+        db, job_id, "project.3mf", "3MF project file not found."
+    )
 
-    if job.status != "completed":
-        raise ApiError(
-            code="JOB_NOT_COMPLETED",
-            message="Job is not completed yet.",
-            http_status=400,
-            details={"job_id": job_id, "status": job.status},
-        )
+    return file_response(
+        request,
+        str(project_path),
+        stat_result,
+        media_type="application/octet-stream",
+        filename=f"{job_id}_project.3mf",
+        headers=IMMUTABLE_CACHE_HEADERS,
+    )
 
-    project_path = storage_service.get_file_path(job_id, "project.3mf")
 
-    if not project_path.exists():
-        raise ApiError(
-            code="FILE_NOT_FOUND",
-            message="3MF project file not found.",
-            http_status=404,
-            details={"job_id": job_id},
-        )
+@router.head("/{job_id}/project.3mf")
+async def head_project_3mf(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """Report 3MF project availability, size and validators without a body."""
+    _, stat_result = await _completed_job_file(
+        db, job_id, "project.3mf", "3MF project file not found."
+    )
 
-    return FileResponse(
-        path=str(project_path),
+    return Response(
         media_type="application/octet-stream",
-        filename=f"{job_id}_project.3mf",
+        headers={**IMMUTABLE_CACHE_HEADERS, **file_headers(stat_result)},
     )
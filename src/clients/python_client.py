@@ -1,10 +1,34 @@
 """Python client for OrcaSlicer API."""
 
-from typing import Optional, Dict, Any, List
+import abc
+import asyncio
+import json
+import mmap
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, AsyncIterator, Iterator, List, Tuple
 from pathlib import Path
+from urllib.parse import urlencode
 import httpx
 
 
+# Bytes read from disk per chunk when streaming uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bytes buffered per write when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are downloaded as parallel byte ranges
+PARALLEL_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+RANGE_PART_SIZE = 8 * 1024 * 1024
+MAX_PARALLEL_RANGES = 4
+
+# Models cannot be modified once uploaded, so cached copies stay valid
+MODEL_MAX_AGE = 300.0
+
+
 class ApiError(Exception):
     """API error exception."""
 
@@ -14,19 +38,266 @@ class ApiError(Exception):
         error_code: str,
         message: str,
         details: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
     ):
         self.status_code = status_code
         self.error_code = error_code
         self.message = message
         self.details = details or {}
+        # Seconds the server asked us to wait (429/503 Retry-After)
+        self.retry_after = retry_after
         super().__init__(f"[{error_code}] {message}")
 
 
-class OrcaSlicerClient:
+class _ClientBase(abc.ABC):
+    """Configuration, ETag cache and request helpers shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        etag_cache_size: int = 256,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 60.0,
+        retries: int = 2,
+        http2: bool = False,
+    ):
+        """
+        Initialize client.
+
+        A single connection pool is kept for the lifetime of the client, so
+        use it as a context manager (or call ``close``) instead of creating
+        one client per request.
+
+        Args:
+            base_url: Base URL of the API (e.g., "http://localhost:8000")
+            timeout: Request timeout in seconds
+            etag_cache_size: Maximum number of ETag-validated responses to keep
+                for conditional GETs (0 disables the cache)
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            retries: Connection attempts retried on connect errors
+            http2: Negotiate HTTP/2 where the server supports it (requires
+                the ``h2`` package, ``pip install httpx[http2]``)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.retries = retries
+        self.http2 = http2
+        self.etag_cache_size = etag_cache_size
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any, float]]" = OrderedDict()
+        self.client = self._make_client()
+
+    @abc.abstractmethod
+    def _make_client(self):
+        """Create the underlying httpx client."""
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise ApiError if the response carries an error status."""
+        if response.status_code < 400:
+            return
+
+        try:
+            retry_after = float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            retry_after = None
+
+        # Parse error response
+        try:
+            error_data = response.json().get("error", {})
+        except (KeyError, ValueError):
+            raise ApiError(
+                status_code=response.status_code,
+                error_code="HTTP_ERROR",
+                message=f"HTTP {response.status_code}: {response.text}",
+                retry_after=retry_after,
+            )
+
+        raise ApiError(
+            status_code=response.status_code,
+            error_code=error_data.get("code", "UNKNOWN_ERROR"),
+            message=error_data.get("message", "Unknown error occurred"),
+            details=error_data.get("details", {}),
+            retry_after=retry_after,
+        )
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Key cached responses by path and query parameters."""
+        if not params:
+            return path
+        return f"{path}?{urlencode(sorted(params.items()))}"
+
+    def _prepare_request(
+        self,
+        key: str,
+        cacheable: bool,
+        max_age: float,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[Tuple[str, Any, float]], bool]:
+        """
+        Look up a cacheable GET in the ETag cache.
+
+        Returns the cached (etag, body, validated_at) entry, if any, and
+        whether it is still within ``max_age`` and can be used without a
+        request. Otherwise If-None-Match is added to ``kwargs``.
+        """
+        cached = self._etag_cache.get(key) if cacheable else None
+        if cached is None:
+            return None, False
+
+        if time.monotonic() - cached[2] < max_age:
+            self._etag_cache.move_to_end(key)
+            return cached, True
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["If-None-Match"] = cached[0]
+        kwargs["headers"] = headers
+        return cached, False
+
+    def _parse_or_raise(
+        self,
+        response: httpx.Response,
+        key: str,
+        cacheable: bool,
+        cached: Optional[Tuple[str, Any, float]],
+    ) -> Any:
+        """Decode a response, serving 304s from and storing ETags in the cache."""
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache[key] = (cached[0], cached[1], time.monotonic())
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+
+        self._raise_for_status(response)
+
+        if response.status_code == 204:
+            return None
+
+        data = response.json()
+
+        etag = response.headers.get("etag")
+        if cacheable and etag:
+            self._etag_cache[key] = (etag, data, time.monotonic())
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self.etag_cache_size:
+                self._etag_cache.popitem(last=False)
+
+        return data
+
+    @staticmethod
+    def _multipart_envelope(filename: str, size: int) -> Tuple[Dict[str, str], bytes, bytes]:
+        """
+        Build the framing of a multipart/form-data body with one file field.
+
+        Returns the request headers (with an exact Content-Length for a file
+        of ``size`` bytes) and the bytes sent before and after the file.
+        """
+        boundary = secrets.token_hex(16)
+        # Escape as browsers do (WHATWG multipart/form-data encoding)
+        safe_name = filename.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+        preamble = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        epilogue = f"\r\n--{boundary}--\r\n".encode()
+
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(preamble) + size + len(epilogue)),
+        }
+        return headers, preamble, epilogue
+
+    @staticmethod
+    def _slice_job_payload(
+        model_id: str,
+        profile_id: str,
+        overrides: Optional[Dict[str, Any]],
+        output_options: Optional[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the request body for creating a slice job."""
+        job_data = {
+            "model_id": model_id,
+            "profile_id": profile_id,
+        }
+
+        if overrides:
+            job_data["overrides"] = overrides
+        if output_options:
+            job_data["output_options"] = output_options
+        if metadata:
+            job_data["metadata"] = metadata
+
+        return job_data
+
+    @staticmethod
+    def _long_poll_kwargs(timeout: float, wait: Optional[int]) -> Dict[str, Any]:
+        """Request options asking the server to hold a GET up to ``wait`` seconds."""
+        if not wait:
+            return {}
+        return {"headers": {"Prefer": f"wait={wait}"}, "timeout": timeout + wait}
+
+    @staticmethod
+    def _parse_event(line: str) -> Optional[Dict[str, Any]]:
+        """Decode an SSE ``data:`` line; other lines yield None."""
+        if not line.startswith("data:"):
+            return None
+        return json.loads(line[len("data:"):])
+
+    @staticmethod
+    def _load_download_etag(dest_path: str) -> Optional[Tuple[str, str]]:
+        """Return the (etag, content encoding) saved next to a previous download.
+
+        The server tags each encoding of a file (identity or precompressed
+        gzip) with its own ETag, so a saved ETag only validates requests for
+        the same encoding.
+        """
+        if not os.path.exists(dest_path):
+            return None
+        try:
+            lines = Path(f"{dest_path}.etag").read_text().split()
+        except FileNotFoundError:
+            return None
+        if not lines:
+            return None
+        return lines[0], lines[1] if len(lines) > 1 else "identity"
+
+    @staticmethod
+    def _store_download_etag(
+        dest_path: str, etag: Optional[str], encoding: str = "identity"
+    ) -> None:
+        """Save (or, with None, forget) the ETag of the file at dest_path."""
+        sidecar = Path(f"{dest_path}.etag")
+        if etag:
+            sidecar.write_text(f"{etag}\n{encoding}\n")
+        else:
+            sidecar.unlink(missing_ok=True)
+
+    @staticmethod
+    def _revalidation_headers(saved: Optional[Tuple[str, str]]) -> Optional[Dict[str, str]]:
+        """Headers asking whether a saved download is current, in its own encoding."""
+        if saved is None:
+            return None
+        etag, encoding = saved
+        return {"If-None-Match": etag, "Accept-Encoding": encoding}
+
+
+class OrcaSlicerClient(_ClientBase):
     """
     Python client for OrcaSlicer API.
 
     Example usage:
+        # Reuse one client (and its connection pool); close it when done,
+        # or use it as a context manager: `with OrcaSlicerClient(...) as client:`
         client = OrcaSlicerClient(base_url="http://localhost:8000")
 
         # Upload model
@@ -62,82 +333,91 @@ class OrcaSlicerClient:
         if job["status"] == "completed":
             client.download_gcode(job["id"], "output.gcode")
             client.download_project_3mf(job["id"], "project.3mf")
-    """
 
-    def __init__(self, base_url: str, timeout: float = 30.0):
-        """
-        Initialize client.
+        client.close()
+    """
 
-        Args:
-            base_url: Base URL of the API (e.g., "http://localhost:8000")
-            timeout: Request timeout in seconds
-        """
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+    def _make_client(self) -> httpx.Client:
+        """Create the pooled sync client."""
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=httpx.HTTPTransport(
+                limits=self.limits, http2=self.http2, retries=self.retries
+            ),
+        )
 
     def _request(
         self,
         method: str,
         path: str,
+        cacheable: bool = False,
+        max_age: float = 0.0,
         **kwargs,
     ) -> Any:
-        """Make HTTP request and handle errors."""
-        url = f"{self.base_url}{path}"
-        response = self.client.request(method, url, **kwargs)
-
-        if response.status_code >= 400:
-            # Parse error response
-            try:
-                error_data = response.json().get("error", {})
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code=error_data.get("code", "UNKNOWN_ERROR"),
-                    message=error_data.get("message", "Unknown error occurred"),
-                    details=error_data.get("details", {}),
-                )
-            except (KeyError, ValueError):
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code="HTTP_ERROR",
-                    message=f"HTTP {response.status_code}: {response.text}",
-                )
+        """
+        Make HTTP request and handle errors.
 
-        if response.status_code == 204:
-            return None
+        When ``cacheable`` is set on a GET, the last seen ETag for the URL is
+        sent as If-None-Match and a 304 response returns the cached body.
+        A cached body validated less than ``max_age`` seconds ago is returned
+        without a request. Cached bodies are shared between calls and should
+        not be mutated.
+        """
+        cacheable = cacheable and method == "GET" and self.etag_cache_size > 0
+        key = self._cache_key(path, kwargs.get("params"))
+        cached, fresh = self._prepare_request(key, cacheable, max_age, kwargs)
+        if fresh:
+            return cached[1]
 
-        return response.json()
+        response = self.client.request(method, path, **kwargs)
+        return self._parse_or_raise(response, key, cacheable, cached)
 
     def upload_model(
         self,
         path: str,
         original_name: Optional[str] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
     ) -> Dict[str, Any]:
         """
         Upload a 3D model file.
 
+        The file is streamed from disk in ``chunk_size`` pieces, so memory use
+        stays constant regardless of model size.
+
         Args:
             path: Path to the model file
             original_name: Original filename (defaults to basename of path)
+            chunk_size: Bytes read from disk per chunk
 
         Returns:
             Model metadata dict with keys: id, filename, format, size_bytes,
             uploaded_at, checksum_sha256, storage_path
         """
-        file_path = Path(path)
-        if not file_path.exists():
+        # One stat both checks existence and sizes the body
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {path}")
 
-        filename = original_name or file_path.name
+        filename = original_name or os.path.basename(path)
+
+        headers, preamble, epilogue = self._multipart_envelope(filename, size)
+
+        def body() -> Iterator[bytes]:
+            yield preamble
+            with open(path, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+            yield epilogue
 
-        with open(file_path, "rb") as f:
-            files = {"file": (filename, f)}
-            return self._request("POST", "/models", files=files)
+        return self._request("POST", "/models", content=body(), headers=headers)
 
     def list_models(
         self,
         limit: int = 20,
         offset: int = 0,
+        max_age: float = 0.0,
     ) -> List[Dict[str, Any]]:
         """
         List uploaded models.
@@ -145,6 +425,7 @@ class OrcaSlicerClient:
         Args:
             limit: Maximum number of models to return
             offset: Number of models to skip
+            max_age: Seconds a cached listing is reused without revalidating
 
         Returns:
             List of model metadata dicts
@@ -152,21 +433,27 @@ class OrcaSlicerClient:
         response = self._request(
             "GET",
             "/models",
+            cacheable=True,
+            max_age=max_age,
             params={"limit": limit, "offset": offset},
         )
         return response["items"]
 
-    def get_model(self, model_id: str) -> Dict[str, Any]:
+    def get_model(self, model_id: str, max_age: float = MODEL_MAX_AGE) -> Dict[str, Any]:
         """
         Get model details.
 
         Args:
             model_id: Model ID
+            max_age: Seconds a cached model is reused without revalidating.
+                Models are immutable, so this defaults to a long policy.
 
         Returns:
             Model metadata dict
         """
-        return self._request("GET", f"/models/{model_id}")
+        return self._request(
+            "GET", f"/models/{model_id}", cacheable=True, max_age=max_age
+        )
 
     def create_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -181,11 +468,25 @@ class OrcaSlicerClient:
         """
         return self._request("POST", "/profiles", json=profile)
 
+    def create_profiles(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several slicing profiles in one request.
+
+        Args:
+            profiles: Profile data dicts, as for create_profile
+
+        Returns:
+            Created profile dicts, in the same order
+        """
+        response = self._request("POST", "/profiles/batch", json={"items": profiles})
+        return response["items"]
+
     def list_profiles(
         self,
         source: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        max_age: float = 0.0,
     ) -> List[Dict[str, Any]]:
         """
         List slicing profiles.
@@ -194,6 +495,7 @@ class OrcaSlicerClient:
             source: Filter by source ("builtin" or "user")
             limit: Maximum number of profiles to return
             offset: Number of profiles to skip
+            max_age: Seconds a cached listing is reused without revalidating
 
         Returns:
             List of profile dicts
@@ -202,20 +504,25 @@ class OrcaSlicerClient:
         if source:
             params["source"] = source
 
-        response = self._request("GET", "/profiles", params=params)
+        response = self._request(
+            "GET", "/profiles", cacheable=True, max_age=max_age, params=params
+        )
         return response["items"]
 
-    def get_profile(self, profile_id: str) -> Dict[str, Any]:
+    def get_profile(self, profile_id: str, max_age: float = 0.0) -> Dict[str, Any]:
         """
         Get profile details.
 
         Args:
             profile_id: Profile ID
+            max_age: Seconds a cached profile is reused without revalidating
 
         Returns:
             Profile dict
         """
-        return self._request("GET", f"/profiles/{profile_id}")
+        return self._request(
+            "GET", f"/profiles/{profile_id}", cacheable=True, max_age=max_age
+        )
 
     def update_profile(
         self,
@@ -264,31 +571,105 @@ class OrcaSlicerClient:
         Returns:
             Created slice job dict
         """
-        job_data = {
-            "model_id": model_id,
-            "profile_id": profile_id,
-        }
-
-        if overrides:
-            job_data["overrides"] = overrides
-        if output_options:
-            job_data["output_options"] = output_options
-        if metadata:
-            job_data["metadata"] = metadata
-
+        job_data = self._slice_job_payload(model_id, profile_id, overrides, output_options, metadata)
         return self._request("POST", "/slice-jobs", json=job_data)
 
-    def get_slice_job(self, job_id: str) -> Dict[str, Any]:
+    def get_slice_job(self, job_id: str, wait: Optional[int] = None) -> Dict[str, Any]:
         """
         Get slice job status and results.
 
         Args:
             job_id: Job ID
+            wait: Long-poll for up to this many seconds: if the job has not
+                changed since the last call, the server holds the request
+                until it does (``Prefer: wait=N``)
 
         Returns:
             Slice job dict with status and output (if completed)
         """
-        return self._request("GET", f"/slice-jobs/{job_id}")
+        return self._request(
+            "GET",
+            f"/slice-jobs/{job_id}",
+            cacheable=True,
+            **self._long_poll_kwargs(self.timeout, wait),
+        )
+
+    def get_slice_job_status(self, job_id: str, wait: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get only the status and progress of a slice job.
+
+        Much smaller than ``get_slice_job``; poll this and fetch the full job
+        once the status is "completed" or "failed".
+
+        Args:
+            job_id: Job ID
+            wait: Long-poll for up to this many seconds (see ``get_slice_job``)
+
+        Returns:
+            Dict with keys: id, status, progress_percent, finished_at
+        """
+        return self._request(
+            "GET",
+            f"/slice-jobs/{job_id}/status",
+            cacheable=True,
+            **self._long_poll_kwargs(self.timeout, wait),
+        )
+
+    def stream_slice_job_events(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream slice job status transitions.
+
+        Holds a single Server-Sent Events connection open instead of polling.
+        The iterator ends once the job reaches "completed" or "failed".
+
+        Args:
+            job_id: Job ID
+
+        Yields:
+            Event dicts with keys: id, status, progress_percent
+        """
+        path = f"/slice-jobs/{job_id}/events"
+        with self.client.stream("GET", path, headers={"Accept": "text/event-stream"}) as response:
+            if response.status_code >= 400:
+                response.read()
+                self._raise_for_status(response)
+
+            for line in response.iter_lines():
+                event = self._parse_event(line)
+                if event is None:
+                    continue
+                yield event
+                if event["status"] in ("completed", "failed"):
+                    return
+
+    def _download(self, path: str, dest_path: str) -> None:
+        """
+        Stream a job output to disk one chunk at a time.
+
+        The ETag is saved to ``<dest_path>.etag`` with the encoding it was
+        served in; when both files are still there, the download is skipped
+        if the server reports no change.
+        """
+        headers = self._revalidation_headers(self._load_download_etag(dest_path))
+
+        with self.client.stream("GET", path, headers=headers) as response:
+            if response.status_code == 304:
+                return
+            if response.status_code >= 400:
+                response.read()
+                self._raise_for_status(response)
+
+            # Forget the old ETag first so a failed write is never trusted
+            self._store_download_etag(dest_path, None)
+            with open(dest_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+        self._store_download_etag(
+            dest_path,
+            response.headers.get("etag"),
+            response.headers.get("content-encoding", "identity"),
+        )
 
     def download_gcode(self, job_id: str, dest_path: str) -> None:
         """
@@ -298,27 +679,7 @@ class OrcaSlicerClient:
             job_id: Job ID
             dest_path: Destination file path
         """
-        url = f"{self.base_url}/slice-jobs/{job_id}/gcode"
-        response = self.client.get(url)
-
-        if response.status_code >= 400:
-            try:
-                error_data = response.json().get("error", {})
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code=error_data.get("code", "UNKNOWN_ERROR"),
-                    message=error_data.get("message", "Unknown error occurred"),
-                    details=error_data.get("details", {}),
-                )
-            except (KeyError, ValueError):
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code="HTTP_ERROR",
-                    message=f"HTTP {response.status_code}: {response.text}",
-                )
-
-        with open(dest_path, "wb") as f:
-            f.write(response.content)
+        self._download(f"/slice-jobs/{job_id}/gcode", dest_path)
 
     def download_project_3mf(self, job_id: str, dest_path: str) -> None:
         """
@@ -328,27 +689,7 @@ class OrcaSlicerClient:
             job_id: Job ID
             dest_path: Destination file path
         """
-        url = f"{self.base_url}/slice-jobs/{job_id}/project.3mf"
-        response = self.client.get(url)
-
-        if response.status_code >= 400:
-            try:
-                error_data = response.json().get("error", {})
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code=error_data.get("code", "UNKNOWN_ERROR"),
-                    message=error_data.get("message", "Unknown error occurred"),
-                    details=error_data.get("details", {}),
-                )
-            except (KeyError, ValueError):
-                raise ApiError(
-                    status_code=response.status_code,
-                    error_code="HTTP_ERROR",
-                    message=f"HTTP {response.status_code}: {response.text}",
-                )
-
-        with open(dest_path, "wb") as f:
-            f.write(response.content)
+        self._download(f"/slice-jobs/{job_id}/project.3mf", dest_path)
 
     def close(self):
         """Close the HTTP client."""
@@ -361,3 +702,283 @@ class OrcaSlicerClient:
     def __exit__(self, *args):
         """Context manager exit."""
         self.close()
+
+
+class AsyncOrcaSlicerClient(_ClientBase):
+    """
+    Asyncio client for OrcaSlicer API.
+
+    Mirrors OrcaSlicerClient with ``async`` methods and takes the same
+    options, so many jobs can be polled or downloaded concurrently over one
+    connection pool:
+
+        async with AsyncOrcaSlicerClient(base_url="http://localhost:8000") as client:
+            jobs = await asyncio.gather(
+                *(client.get_slice_job_status(job_id) for job_id in job_ids)
+            )
+
+    File I/O for uploads and small downloads runs in worker threads to keep
+    the event loop responsive.
+    """
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the pooled async client."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                limits=self.limits, http2=self.http2, retries=self.retries
+            ),
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        cacheable: bool = False,
+        max_age: float = 0.0,
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request and handle errors (see OrcaSlicerClient._request)."""
+        cacheable = cacheable and method == "GET" and self.etag_cache_size > 0
+        key = self._cache_key(path, kwargs.get("params"))
+        cached, fresh = self._prepare_request(key, cacheable, max_age, kwargs)
+        if fresh:
+            return cached[1]
+
+        response = await self.client.request(method, path, **kwargs)
+        return self._parse_or_raise(response, key, cacheable, cached)
+
+    async def upload_model(
+        self,
+        path: str,
+        original_name: Optional[str] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Upload a 3D model file, streamed from disk."""
+        try:
+            size = (await asyncio.to_thread(os.stat, path)).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        filename = original_name or os.path.basename(path)
+        headers, preamble, epilogue = self._multipart_envelope(filename, size)
+
+        async def body() -> AsyncIterator[bytes]:
+            yield preamble
+            f = await asyncio.to_thread(open, path, "rb")
+            try:
+                while chunk := await asyncio.to_thread(f.read, chunk_size):
+                    yield chunk
+            finally:
+                f.close()
+            yield epilogue
+
+        return await self._request("POST", "/models", content=body(), headers=headers)
+
+    async def list_models(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        max_age: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """List uploaded models."""
+        response = await self._request(
+            "GET",
+            "/models",
+            cacheable=True,
+            max_age=max_age,
+            params={"limit": limit, "offset": offset},
+        )
+        return response["items"]
+
+    async def get_model(
+        self, model_id: str, max_age: float = MODEL_MAX_AGE
+    ) -> Dict[str, Any]:
+        """Get model details."""
+        return await self._request(
+            "GET", f"/models/{model_id}", cacheable=True, max_age=max_age
+        )
+
+    async def create_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new slicing profile."""
+        return await self._request("POST", "/profiles", json=profile)
+
+    async def create_profiles(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several slicing profiles in one request."""
+        response = await self._request("POST", "/profiles/batch", json={"items": profiles})
+        return response["items"]
+
+    async def list_profiles(
+        self,
+        source: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        max_age: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """List slicing profiles."""
+        params = {"limit": limit, "offset": offset}
+        if source:
+            params["source"] = source
+
+        response = await self._request(
+            "GET", "/profiles", cacheable=True, max_age=max_age, params=params
+        )
+        return response["items"]
+
+    async def get_profile(self, profile_id: str, max_age: float = 0.0) -> Dict[str, Any]:
+        """Get profile details."""
+        return await self._request(
+            "GET", f"/profiles/{profile_id}", cacheable=True, max_age=max_age
+        )
+
+    async def update_profile(self, profile_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a profile."""
+        return await self._request("PATCH", f"/profiles/{profile_id}", json=patch)
+
+    async def delete_profile(self, profile_id: str) -> None:
+        """Delete a profile."""
+        await self._request("DELETE", f"/profiles/{profile_id}")
+
+    async def create_slice_job(
+        self,
+        model_id: str,
+        profile_id: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        output_options: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create a new slice job."""
+        job_data = self._slice_job_payload(model_id, profile_id, overrides, output_options, metadata)
+        return await self._request("POST", "/slice-jobs", json=job_data)
+
+    async def get_slice_job(self, job_id: str, wait: Optional[int] = None) -> Dict[str, Any]:
+        """Get slice job status and results, optionally long-polling."""
+        return await self._request(
+            "GET",
+            f"/slice-jobs/{job_id}",
+            cacheable=True,
+            **self._long_poll_kwargs(self.timeout, wait),
+        )
+
+    async def get_slice_job_status(self, job_id: str, wait: Optional[int] = None) -> Dict[str, Any]:
+        """Get only the status and progress of a slice job, optionally long-polling."""
+        return await self._request(
+            "GET",
+            f"/slice-jobs/{job_id}/status",
+            cacheable=True,
+            **self._long_poll_kwargs(self.timeout, wait),
+        )
+
+    async def stream_slice_job_events(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream slice job status transitions until the job finishes."""
+        path = f"/slice-jobs/{job_id}/events"
+        async with self.client.stream("GET", path, headers={"Accept": "text/event-stream"}) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._raise_for_status(response)
+
+            async for line in response.aiter_lines():
+                event = self._parse_event(line)
+                if event is None:
+                    continue
+                yield event
+                if event["status"] in ("completed", "failed"):
+                    return
+
+    async def _download(self, path: str, dest_path: str) -> None:
+        """
+        Download a job output without blocking the event loop.
+
+        Large files are fetched as parallel byte ranges written straight into
+        a preallocated, memory-mapped destination file. As with the sync
+        client, a saved ``<dest_path>.etag`` lets unchanged files be skipped.
+        """
+        saved = await asyncio.to_thread(self._load_download_etag, dest_path)
+
+        # Ranges address the identity encoding, so size it without gzip
+        head = await self.client.head(path, headers={"Accept-Encoding": "identity"})
+        size = int(head.headers.get("content-length", 0))
+        if saved == (head.headers.get("etag"), "identity") and head.status_code == 200:
+            return
+
+        if (
+            head.status_code >= 400
+            or size < PARALLEL_DOWNLOAD_THRESHOLD
+            or head.headers.get("accept-ranges") != "bytes"
+        ):
+            headers = self._revalidation_headers(saved)
+            async with self.client.stream("GET", path, headers=headers) as response:
+                if response.status_code == 304:
+                    return
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response)
+                await asyncio.to_thread(self._store_download_etag, dest_path, None)
+                f = await asyncio.to_thread(open, dest_path, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    f.close()
+            await asyncio.to_thread(
+                self._store_download_etag,
+                dest_path,
+                response.headers.get("etag"),
+                response.headers.get("content-encoding", "identity"),
+            )
+            return
+
+        headers = {"Accept-Encoding": "identity"}
+        if "etag" in head.headers:
+            # Fail the ranges rather than mixing bytes if the file changes
+            headers["If-Range"] = head.headers["etag"]
+
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_RANGES)
+
+        async def fetch_range(dest: mmap.mmap, start: int, end: int) -> None:
+            async with semaphore:
+                range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+                async with self.client.stream("GET", path, headers=range_headers) as response:
+                    if response.status_code != 206:
+                        await response.aread()
+                        self._raise_for_status(response)
+                        raise ApiError(
+                            status_code=response.status_code,
+                            error_code="RANGE_NOT_HONORED",
+                            message=f"Expected partial content for bytes {start}-{end}",
+                        )
+                    offset = start
+                    async for chunk in response.aiter_raw():
+                        dest[offset:offset + len(chunk)] = chunk
+                        offset += len(chunk)
+
+        await asyncio.to_thread(self._store_download_etag, dest_path, None)
+        with open(dest_path, "w+b") as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as dest:
+                await asyncio.gather(*(
+                    fetch_range(dest, start, min(start + RANGE_PART_SIZE, size) - 1)
+                    for start in range(0, size, RANGE_PART_SIZE)
+                ))
+        await asyncio.to_thread(self._store_download_etag, dest_path, head.headers.get("etag"))
+
+    async def download_gcode(self, job_id: str, dest_path: str) -> None:
+        """Download G-code output."""
+        await self._download(f"/slice-jobs/{job_id}/gcode", dest_path)
+
+    async def download_project_3mf(self, job_id: str, dest_path: str) -> None:
+        """Download 3MF project file."""
+        await self._download(f"/slice-jobs/{job_id}/project.3mf", dest_path)
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,43 @@
+"""Response compression limited to JSON bodies."""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .http import accepts_encoding
+
+
+class _JSONGZipResponder(GZipResponder):
+    """GZipResponder that passes non-JSON responses through untouched."""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if not content_type.startswith("application/json"):
+                # Reuse the already-encoded passthrough path
+                self.content_encoding_set = True
+
+
+class JSONGZipMiddleware:
+    """
+    Gzip JSON responses of at least ``minimum_size`` bytes.
+
+    Unlike Starlette's GZipMiddleware, file downloads (which may be byte
+    ranges or already gzipped) and event streams are never buffered or
+    re-encoded.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and accepts_encoding(Request(scope), "gzip"):
+            responder = _JSONGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
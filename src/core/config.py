@@ -1,6 +1,7 @@
 """Application configuration."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 
@@ -16,19 +17,56 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
+    dev_mode: bool = False  # Auto-reload when run via `python -m src.main`
+    # Run new asyncio tasks eagerly (Python 3.12+). Off by default: anyio
+    # releases before 4.4 do not track cancel scopes of eager tasks.
+    eager_tasks: bool = False
+
+    # Comma-separated CORS origins; credentials are only allowed for an
+    # explicit list, since a wildcard has to echo each request's Origin
+    cors_origins: str = "*"
 
     # OrcaSlicer settings
     orca_cli_path: str = os.getenv("ORCA_CLI_PATH", "/usr/local/bin/orcaslicer")
     orca_datadir: str = os.getenv("ORCA_DATADIR", "/app/orca-config")
+    # Slice jobs run at once per process; more wait as queued (0 = one per CPU)
+    max_concurrent_slices: int = 0
+    # Run queued slice jobs in the API process. Disable when dedicated
+    # `python -m src.worker` processes take them instead.
+    run_slice_workers: bool = True
+    # OrcaSlicer runs longer than this are killed and the job fails. Jobs
+    # still marked running well past it have lost their worker and are
+    # queued again.
+    slice_timeout_seconds: int = 3600
 
     # Storage settings
     data_dir: Path = Path(os.getenv("DATA_DIR", "/data"))
     models_dir: Path = data_dir / "models"
     outputs_dir: Path = data_dir / "outputs"
     work_dir: Path = data_dir / "work"
+    # Model uploads up to this size are buffered in memory rather than
+    # spilled to a temporary file and read back before being saved. Each
+    # concurrent upload to POST /models can hold this much memory.
+    upload_spool_max_bytes: int = 64 * 1024 * 1024
+
+    # Cache profiles by ID for a minute. Each worker only drops its own
+    # entries on update, so disable when running several workers.
+    enable_profile_cache: bool = True
+
+    # Output settings
+    precompress_gcode: bool = True  # Store output.gcode.gz next to output.gcode
+    # Stream downloads at least this large without keeping them in the page
+    # cache (0 disables)
+    download_drop_page_cache_bytes: int = 0
+
+    # Rate limiting (per client IP, per worker process; 0 disables)
+    poll_rate_limit_per_second: float = 10.0
+    poll_rate_limit_burst: int = 20
 
     # Database settings
     database_url: str = f"sqlite+aiosqlite:///{data_dir}/orcaslicer.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
 
     # Logging settings
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -47,5 +85,12 @@ class Settings(BaseSettings):
         self.work_dir.mkdir(parents=True, exist_ok=True)
 
 
-settings = Settings()
-settings.setup_directories()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process."""
+    settings = Settings()
+    settings.setup_directories()
+    return settings
+
+
+settings = get_settings()
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
 
@@ -25,11 +25,13 @@ class ApiError(Exception):
         message: str,
         http_status: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         self.code = code
         self.message = message
         self.http_status = http_status
         self.details = details or {}
+        self.headers = headers
         super().__init__(message)
 
 
@@ -81,6 +83,43 @@ class UnsupportedFormatError(ApiError):
         )
 
 
+class ProfileIdConflictError(ApiError):
+    """No free profile ID could be generated."""
+
+    def __init__(self, name: str):
+        super().__init__(
+            code="PROFILE_ID_CONFLICT",
+            message=f"Could not allocate a unique ID for profile '{name}'; retry the request.",
+            http_status=status.HTTP_409_CONFLICT,
+            details={"name": name},
+        )
+
+
+class InvalidCursorError(ApiError):
+    """Malformed pagination cursor."""
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            code="INVALID_CURSOR",
+            message="Pagination cursor is malformed.",
+            http_status=status.HTTP_400_BAD_REQUEST,
+            details={"cursor": cursor},
+        )
+
+
+class RateLimitedError(ApiError):
+    """Client exceeded its request rate."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            code="RATE_LIMITED",
+            message="Too many requests; retry later.",
+            http_status=status.HTTP_429_TOO_MANY_REQUESTS,
+            details={"retry_after": retry_after},
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class SlicingError(ApiError):
     """Slicing operation failed."""
 
@@ -105,9 +144,9 @@ class OrcaCliNotFoundError(ApiError):
         )
 
 
-async def api_error_handler(request: Request, exc: ApiError) -> JSONResponse:
+async def api_error_handler(request: Request, exc: ApiError) -> ORJSONResponse:
     """Handle API errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.http_status,
         content={
             "error": {
@@ -117,14 +156,15 @@ async def api_error_handler(request: Request, exc: ApiError) -> JSONResponse:
                 "details": exc.details,
             }
         },
+        headers=exc.headers,
     )
 
 
 async def validation_error_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -137,9 +177,9 @@ async def validation_error_handler(
     )
 
 
-async def generic_error_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle generic errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -0,0 +1,207 @@
+"""File response helpers with byte-range support."""
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Mapping, Optional
+import anyio
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+from .config import settings
+from .http import etag_matches, not_modified
+
+
+def file_headers(stat_result: os.stat_result) -> dict[str, str]:
+    """Build validator and length headers for a file from a single stat."""
+    return {
+        "Content-Length": str(stat_result.st_size),
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        # Strong ETag so it can be used with If-Range
+        "ETag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+        "Accept-Ranges": "bytes",
+    }
+
+
+def parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into inclusive (start, end) offsets.
+
+    Returns None for headers that should be ignored (malformed or
+    multi-range), and raises ValueError when the range is unsatisfiable.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    if start < 0 or end < start:
+        return None
+
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(FileResponse):
+    """FileResponse that sends only the bytes between start and end (inclusive).
+
+    With ``drop_page_cache`` the kernel is told to read ahead sequentially
+    and to evict each chunk from the page cache once it has been sent, so
+    streaming a large file does not push hot data out of memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        status_code: int = status.HTTP_206_PARTIAL_CONTENT,
+        drop_page_cache: bool = False,
+        **kwargs,
+    ):
+        super().__init__(path, status_code=status_code, **kwargs)
+        self.start = start
+        self.end = end
+        self.drop_page_cache = drop_page_cache and hasattr(os, "posix_fadvise")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        offset = self.start
+        remaining = self.end - self.start + 1
+        fd = await anyio.to_thread.run_sync(os.open, self.path, os.O_RDONLY)
+        try:
+            if self.drop_page_cache:
+                os.posix_fadvise(fd, offset, remaining, os.POSIX_FADV_SEQUENTIAL)
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(
+                    os.pread, fd, min(self.chunk_size, remaining), offset
+                )
+                if not chunk:
+                    break
+                if self.drop_page_cache:
+                    os.posix_fadvise(fd, offset, len(chunk), os.POSIX_FADV_DONTNEED)
+                offset += len(chunk)
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        finally:
+            os.close(fd)
+        if remaining > 0:
+            # File shrank underneath us; terminate the body
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+def _not_modified_since(request: Request, stat_result: os.stat_result) -> bool:
+    """Check If-Modified-Since against the file's mtime (whole seconds)."""
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return False
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since
+
+
+def file_response(
+    request: Request,
+    path: str,
+    stat_result: os.stat_result,
+    media_type: str,
+    filename: str,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Serve a file, honoring ``Range`` / ``If-Range`` for a single byte range.
+
+    ``If-None-Match`` (or, without it, ``If-Modified-Since``) answers 304
+    when the client already has this version. Multi-range and malformed
+    requests fall back to the full file. Files of at least
+    ``settings.download_drop_page_cache_bytes`` are streamed without leaving
+    their pages cached.
+    """
+    response_headers = {**(headers or {}), **file_headers(stat_result)}
+    size = stat_result.st_size
+    threshold = settings.download_drop_page_cache_bytes
+    drop_page_cache = 0 < threshold <= size
+
+    etag = response_headers["ETag"]
+    if "if-none-match" in request.headers:
+        if etag_matches(request, etag):
+            return not_modified(etag)
+    elif _not_modified_since(request, stat_result):
+        return not_modified(etag)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            response_headers["Content-Length"] = str(end - start + 1)
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return RangeFileResponse(
+                path,
+                start,
+                end,
+                media_type=media_type,
+                filename=filename,
+                stat_result=stat_result,
+                headers=response_headers,
+                drop_page_cache=drop_page_cache,
+            )
+
+    if drop_page_cache:
+        return RangeFileResponse(
+            path,
+            0,
+            size - 1,
+            status_code=status.HTTP_200_OK,
+            drop_page_cache=True,
+            media_type=media_type,
+            filename=filename,
+            stat_result=stat_result,
+            headers=response_headers,
+        )
+
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+        headers=response_headers,
+    )
@@ -0,0 +1,60 @@
+"""HTTP helpers shared by the API routes."""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values that identify a resource version."""
+    raw = "-".join(
+        str(int(p.timestamp() * 1000)) if isinstance(p, datetime) else str(p)
+        for p in parts
+    )
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on both sides
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def accepts_encoding(request: Request, encoding: str) -> bool:
+    """Check whether the request's Accept-Encoding allows the given coding."""
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in (encoding, "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def prefer_wait(request: Request) -> Optional[int]:
+    """Return N from a ``Prefer: wait=N`` header (RFC 7240), if present."""
+    for preference in request.headers.get("prefer", "").split(","):
+        name, _, value = preference.partition("=")
+        if name.strip().lower() == "wait":
+            try:
+                return max(int(value.strip().strip('"')), 0)
+            except ValueError:
+                return None
+    return None
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
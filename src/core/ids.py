@@ -0,0 +1,34 @@
+"""Random suffixes for resource IDs."""
+
+import os
+import threading
+
+
+# Bytes pulled from the OS per refill; one getrandom() call covers
+# about a thousand 4-byte suffixes
+_POOL_SIZE = 4096
+
+_pool = b""
+_pos = 0
+_lock = threading.Lock()
+
+
+def random_hex(nbytes: int) -> str:
+    """Return ``nbytes`` random bytes as hex, drawn from a buffered urandom pool."""
+    global _pool, _pos
+    with _lock:
+        if _pos + nbytes > len(_pool):
+            _pool = os.urandom(max(_POOL_SIZE, nbytes))
+            _pos = 0
+        chunk = _pool[_pos:_pos + nbytes]
+        _pos += nbytes
+    return chunk.hex()
+
+
+def _reset_pool():
+    global _pool, _pos
+    _pool, _pos = b"", 0
+
+
+# A forked worker must not hand out the same suffixes as its parent
+os.register_at_fork(after_in_child=_reset_pool)
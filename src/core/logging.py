@@ -2,19 +2,29 @@
 
 import logging
 import sys
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
+import orjson
 from .config import settings
 
 
+# LogRecord attributes that are not user-supplied extra fields
+_RESERVED_ATTRS = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "message", "pathname", "process", "processName",
+    "relativeCreated", "thread", "threadName", "exc_info",
+    "exc_text", "stack_info", "taskName",
+})
+
+
 class JsonFormatter(logging.Formatter):
     """JSON log formatter."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,16 +33,14 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in ["name", "msg", "args", "created", "filename", "funcName",
-                          "levelname", "levelno", "lineno", "module", "msecs",
-                          "message", "pathname", "process", "processName",
-                          "relativeCreated", "thread", "threadName", "exc_info",
-                          "exc_text", "stack_info"]:
-                log_data[key] = value
+        # Add extra fields; most records have none, which a C-level subset
+        # check detects without walking the attributes
+        if not record.__dict__.keys() <= _RESERVED_ATTRS:
+            for key, value in record.__dict__.items():
+                if key not in _RESERVED_ATTRS:
+                    log_data[key] = value
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z).decode()
 
 
 def setup_logging():
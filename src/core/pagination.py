@@ -0,0 +1,63 @@
+"""Keyset pagination helpers."""
+
+import base64
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from fastapi import Request, Response
+from sqlalchemy import DateTime, Row, Select, and_, literal, or_
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+from .errors import InvalidCursorError
+
+
+# Pages at least this large are read through a server-side cursor; below
+# it, one buffered fetch is cheaper than the per-batch round-trips
+STREAM_MIN_LIMIT = 50
+
+# SQLite stores CURRENT_TIMESTAMP defaults as second-precision text; bind
+# whole-second cursors in the same format so the text comparison lines up
+_SECOND_PRECISION = DateTime().with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
+
+
+def encode_cursor(ts: datetime, row_id: str) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor."""
+    raw = json.dumps([ts.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ts, row_id = json.loads(raw)
+        return datetime.fromisoformat(ts), str(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursorError(cursor)
+
+
+def after_cursor(ts_column, id_column, cursor: str) -> ColumnElement:
+    """Filter for rows following the cursor in ``ts DESC, id DESC`` order."""
+    ts, row_id = decode_cursor(cursor)
+    ts_value = literal(ts, _SECOND_PRECISION if ts.microsecond == 0 else DateTime())
+    return or_(ts_column < ts_value, and_(ts_column == ts_value, id_column < row_id))
+
+
+def set_next_link(request: Request, response: Response, next_cursor: Optional[str]):
+    """Advertise the next page via a ``Link: <...>; rel="next"`` header."""
+    if next_cursor:
+        url = request.url.remove_query_params("offset").include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{url}>; rel="next"'
+
+
+async def iter_page_rows(db: AsyncSession, query: Select, limit: int) -> AsyncIterator[Row]:
+    """Yield the rows of a page query, streaming them when the page is large."""
+    if limit < STREAM_MIN_LIMIT:
+        for row in (await db.execute(query)).all():
+            yield row
+        return
+    async for row in await db.stream(query):
+        yield row
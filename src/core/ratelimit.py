@@ -0,0 +1,50 @@
+"""In-memory rate limiting."""
+
+import math
+import time
+from typing import Hashable
+from fastapi import Request
+from .cache import TTLCache
+from .errors import RateLimitedError
+
+
+class TokenBucketLimiter:
+    """Per-key token bucket refilled at ``rate`` tokens per second.
+
+    State lives in process memory, so each worker enforces its own limit.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        # An idle bucket is full again after burst / rate seconds, after
+        # which dropping it is equivalent to keeping it
+        self._buckets = TTLCache(maxsize=max_keys, ttl=max(burst / rate, 1.0) if rate > 0 else 1.0)
+
+    def acquire(self, key: Hashable) -> float:
+        """Take a token; return 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        if tokens >= 1:
+            self._buckets.set(key, (tokens - 1, now))
+            return 0.0
+
+        self._buckets.set(key, (tokens, now))
+        return (1 - tokens) / self.rate
+
+
+def rate_limit(rate: float, burst: int):
+    """Build a route dependency limiting each client IP; ``rate <= 0`` disables it."""
+    limiter = TokenBucketLimiter(rate, burst)
+
+    async def dependency(request: Request):
+        if limiter.rate <= 0:
+            return
+        key = request.client.host if request.client else "unknown"
+        wait = limiter.acquire(key)
+        if wait:
+            raise RateLimitedError(math.ceil(wait))
+
+    return dependency
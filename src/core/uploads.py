@@ -0,0 +1,60 @@
+"""Multipart parsing for model uploads."""
+
+from typing import AsyncIterator
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import FormData, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+from .config import settings
+
+
+class _SpooledMultiPartParser(MultiPartParser):
+    """MultiPartParser keeping file parts in memory up to the upload spool size."""
+
+    max_file_size = settings.upload_spool_max_bytes
+
+
+# Request body documented for routes taking their upload via model_upload
+MODEL_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+async def model_upload(request: Request) -> AsyncIterator[UploadFile]:
+    """
+    Route dependency yielding the ``file`` part of a multipart upload.
+
+    The file is kept in memory up to ``upload_spool_max_bytes`` and spills
+    to a temporary file past that. Other multipart routes keep Starlette's
+    1 MiB default, so they don't hold that much memory per request.
+    """
+    form = FormData()
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        try:
+            form = await _SpooledMultiPartParser(request.headers, request.stream()).parse()
+        except MultiPartException as exc:
+            raise HTTPException(status_code=400, detail=exc.message)
+
+    try:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise RequestValidationError([{
+                "type": "missing",
+                "loc": ("body", "file"),
+                "msg": "Field required",
+                "input": None,
+            }])
+        yield file
+    finally:
+        await form.close()
@@ -1,17 +1,78 @@
 """Database setup and session management."""
 
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Type, TypeVar
+import orjson
+from sqlalchemy import event, func, insert, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .models.db_models import Base
 from .core.config import settings
 
 
-# Create async engine
+# Applied to every new SQLite connection: WAL lets polls read while a job
+# update is being written, and NORMAL sync is durable under WAL except
+# on power loss.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Passed to asyncpg when DATABASE_URL points at PostgreSQL: a larger
+# prepared statement cache per connection, and no JIT, which mostly slows
+# down short queries and asyncpg's type introspection.
+ASYNCPG_CONNECT_ARGS = {
+    "prepared_statement_cache_size": 1024,
+    "server_settings": {"jit": "off"},
+}
+
+
+# Below this many rows an exact COUNT is cheap enough, and planner
+# statistics for small or fresh tables are too rough to show
+ESTIMATED_COUNT_MIN_ROWS = 100_000
+
+_ESTIMATE_ROWS = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON columns with orjson (str keys, like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_is_asyncpg = settings.database_url.startswith("postgresql+asyncpg")
+
+# Create async engine. aiosqlite defaults to NullPool, which opens a new
+# connection (and thread) per session; keep a pool of them instead.
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    # Network databases can drop idle connections; a local file cannot
+    pool_pre_ping=_is_asyncpg,
+    connect_args=ASYNCPG_CONNECT_ARGS if _is_asyncpg else {},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection."""
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 # Create session maker
 async_session_maker = async_sessionmaker(
     engine,
@@ -20,10 +81,79 @@ async_session_maker = async_sessionmaker(
 )
 
 
+def _create_schema(conn):
+    """Create missing tables, and indexes added to tables that already exist."""
+    Base.metadata.create_all(conn)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_schema)
+
+
+T = TypeVar("T")
+
+
+async def insert_returning(session: AsyncSession, model: Type[T], values: Dict[str, Any]) -> T:
+    """Insert one row and load it back, defaults included, with INSERT ... RETURNING."""
+    result = await session.scalars(insert(model).returning(model), [values])
+    return result.one()
+
+
+def _insert_skipping_conflicts(model: Type[T]):
+    """INSERT that silently skips rows whose primary key already exists."""
+    dialect_insert = postgresql.insert if engine.dialect.name == "postgresql" else sqlite.insert
+    return dialect_insert(model).on_conflict_do_nothing(
+        index_elements=inspect(model).primary_key
+    )
+
+
+async def insert_new_returning(
+    session: AsyncSession, model: Type[T], values: Dict[str, Any]
+) -> Optional[T]:
+    """Insert one row with ON CONFLICT DO NOTHING; None if the key was taken."""
+    result = await session.scalars(_insert_skipping_conflicts(model).returning(model), [values])
+    return result.one_or_none()
+
+
+async def insert_many_new_returning(
+    session: AsyncSession, model: Type[T], rows: List[Dict[str, Any]]
+) -> List[T]:
+    """Insert rows with ON CONFLICT DO NOTHING, returning only those inserted."""
+    result = await session.scalars(_insert_skipping_conflicts(model).returning(model), rows)
+    return list(result.all())
+
+
+async def estimated_row_count(session: AsyncSession, model: Type[T]) -> Optional[int]:
+    """
+    Estimate a table's row count from PostgreSQL's planner statistics.
+
+    Returns None on other databases, or when the table is too small (or
+    not yet analyzed) for the estimate to be worth using over a COUNT.
+    """
+    if engine.dialect.name != "postgresql":
+        return None
+    result = await session.execute(_ESTIMATE_ROWS, {"table": model.__tablename__})
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < ESTIMATED_COUNT_MIN_ROWS:
+        return None
+    return estimate
+
+
+def seconds_ago(seconds: int):
+    """SQL expression for the database clock's time ``seconds`` ago.
+
+    Compares like with like against timestamps written with ``func.now()``,
+    whatever the clock or time zone of the host issuing the query.
+    """
+    if engine.dialect.name == "sqlite":
+        # CURRENT_TIMESTAMP is text; datetime() returns the same format
+        return func.datetime("now", f"-{int(seconds)} seconds")
+    return func.now() - timedelta(seconds=seconds)
 
 
 async def get_db() -> AsyncSession:
@@ -1,9 +1,12 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from .core.compression import JSONGZipMiddleware
 from .core.config import settings
 from .core.errors import (
     ApiError,
@@ -13,6 +16,8 @@ from .core.errors import (
 )
 from .core.logging import logger
 from .database import init_db
+from .services.slice_service import slice_service
+from .services.storage_service import storage_service
 from .api import routes_models, routes_profiles, routes_slice_jobs, routes_health
 
 
@@ -21,13 +26,24 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     logger.info("Starting OrcaSlicer API")
+    if settings.eager_tasks and hasattr(asyncio, "eager_task_factory"):
+        # Python 3.12+: tasks that finish without blocking (cache hits,
+        # buffered results) complete without a trip through the scheduler
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     await init_db()
     logger.info("Database initialized")
+    warm_up = asyncio.create_task(slice_service.warm_up())
+    if settings.run_slice_workers:
+        await slice_service.requeue_stale_jobs()
+        slice_service.start_dispatchers()
 
     yield
 
     # Shutdown
     logger.info("Shutting down OrcaSlicer API")
+    warm_up.cancel()
+    await slice_service.stop_dispatchers()
+    await asyncio.to_thread(storage_service.close)
 
 
 # Create FastAPI app
@@ -36,20 +52,25 @@ app = FastAPI(
     version=settings.api_version,
     description=settings.api_description,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
 )
 
 # Add CORS middleware
+cors_origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials="*" not in cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies such as profile lists and slice metadata
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Register error handlers
 app.add_exception_handler(ApiError, api_error_handler)
 app.add_exception_handler(RequestValidationError, validation_error_handler)
@@ -79,5 +100,7 @@ if __name__ == "__main__":
         "src.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.dev_mode,
     )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, String, Integer, DateTime, JSON, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, DateTime, JSON, Text, Index, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 import enum
@@ -22,6 +22,10 @@ class Model(Base):
     """Uploaded model."""
 
     __tablename__ = "models"
+    __table_args__ = (
+        # Newest-first keyset pagination
+        Index("ix_models_uploaded_at_id", "uploaded_at", "id"),
+    )
 
     id = Column(String, primary_key=True)
     filename = Column(String, nullable=False)
@@ -36,6 +40,11 @@ class Profile(Base):
     """Slicing profile."""
 
     __tablename__ = "profiles"
+    __table_args__ = (
+        # Newest-first keyset pagination, with and without a source filter
+        Index("ix_profiles_created_at_id", "created_at", "id"),
+        Index("ix_profiles_source_created_at_id", "source", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True)
     name = Column(String, nullable=False)
@@ -54,10 +63,14 @@ class SliceJob(Base):
     """Slice job."""
 
     __tablename__ = "slice_jobs"
+    __table_args__ = (
+        # Status sweeps and picking the oldest queued job
+        Index("ix_slice_jobs_status_queued_at", "status", "queued_at"),
+    )
 
     id = Column(String, primary_key=True)
-    model_id = Column(String, nullable=False)
-    profile_id = Column(String, nullable=False)
+    model_id = Column(String, nullable=False, index=True)
+    profile_id = Column(String, nullable=False, index=True)
     status = Column(SQLEnum(SliceJobStatus), nullable=False, default=SliceJobStatus.QUEUED)
     overrides = Column(JSON)
     output_options = Column(JSON)
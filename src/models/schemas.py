@@ -2,13 +2,15 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 # Model schemas
 class ModelResponse(BaseModel):
     """Model response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     filename: str
     format: str
@@ -18,11 +20,17 @@ class ModelResponse(BaseModel):
     storage_path: str
 
 
+# Validates a page of column mappings (not ORM rows) in a single
+# pydantic-core call
+MODEL_LIST_ADAPTER = TypeAdapter(List[ModelResponse])
+
+
 class ModelListResponse(BaseModel):
     """Model list response."""
 
     items: List[ModelResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # Profile schemas
@@ -39,6 +47,16 @@ class ProfileCreate(BaseModel):
     settings_overrides: Optional[Dict[str, Any]] = None
 
 
+# Most profiles accepted by one POST /profiles/batch request
+MAX_PROFILE_BATCH_SIZE = 500
+
+
+class ProfileBatchCreate(BaseModel):
+    """Create several profiles in one request."""
+
+    items: List[ProfileCreate] = Field(min_length=1, max_length=MAX_PROFILE_BATCH_SIZE)
+
+
 class ProfileUpdate(BaseModel):
     """Update profile request."""
 
@@ -51,8 +69,10 @@ class ProfileUpdate(BaseModel):
     settings_overrides: Optional[Dict[str, Any]] = None
 
 
-class ProfileResponse(BaseModel):
-    """Profile response."""
+class ProfileListItem(BaseModel):
+    """Profile as shown in listings, without its settings overrides."""
+
+    model_config = ConfigDict(from_attributes=True)
 
     id: str
     name: str
@@ -62,16 +82,34 @@ class ProfileResponse(BaseModel):
     machine_id: Optional[str] = None
     process_id: Optional[str] = None
     filament_id: Optional[str] = None
-    settings_overrides: Optional[Dict[str, Any]] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 
+class ProfileResponse(ProfileListItem):
+    """Profile response."""
+
+    settings_overrides: Optional[Dict[str, Any]] = None
+
+
+# Listings validate column mappings; batch creates validate the inserted ORM
+# rows, with from_attributes=True
+PROFILE_LIST_ADAPTER = TypeAdapter(List[ProfileListItem])
+PROFILE_BATCH_ADAPTER = TypeAdapter(List[ProfileResponse])
+
+
 class ProfileListResponse(BaseModel):
     """Profile list response."""
 
-    items: List[ProfileResponse]
+    items: List[ProfileListItem]
     total: int
+    next_cursor: Optional[str] = None
+
+
+class ProfileBatchResponse(BaseModel):
+    """Profiles created by a batch request, in request order."""
+
+    items: List[ProfileResponse]
 
 
 class ProfileDeleteResponse(BaseModel):
@@ -85,8 +123,6 @@ class ProfileDeleteResponse(BaseModel):
 class OutputOptions(BaseModel):
     """Output options for slice job."""
 
-    model_config = ConfigDict(protected_namespaces=())
-
     gcode: bool = True
     project_3mf: bool = False
     metadata_json: bool = True
@@ -115,6 +151,8 @@ class BoundingBox(BaseModel):
 class SliceMetadata(BaseModel):
     """Slice output metadata."""
 
+    model_config = ConfigDict(protected_namespaces=())
+
     estimated_print_time_seconds: Optional[int] = None
     model_print_time_seconds: Optional[int] = None
     first_layer_print_time_seconds: Optional[int] = None
@@ -152,6 +190,15 @@ class SliceJobResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+class SliceJobStatusResponse(BaseModel):
+    """Lightweight slice job status, for polling."""
+
+    id: str
+    status: str
+    progress_percent: Optional[int] = None
+    finished_at: Optional[datetime] = None
+
+
 # Health check schema
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -160,4 +207,6 @@ class HealthResponse(BaseModel):
     orca_cli_available: bool
     orca_version: Optional[str] = None
     profiles_loaded: int
+    models_stored: Optional[int] = None
+    active_jobs: Optional[int] = None
     uptime_seconds: int
@@ -1,31 +1,71 @@
 """Model management service."""
 
-import secrets
-from pathlib import Path
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO, Optional
-from sqlalchemy import select, func
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.db_models import Model
-from ..models.schemas import ModelResponse, ModelListResponse
+from ..models.schemas import ModelResponse, ModelListResponse, MODEL_LIST_ADAPTER
+from ..core.cache import TTLCache
+from ..database import estimated_row_count, insert_returning
 from ..core.errors import ModelNotFoundError, UnsupportedFormatError
+from ..core.pagination import encode_cursor, after_cursor, iter_page_rows
+from ..core.ids import random_hex
 from .storage_service import storage_service
 
 
-SUPPORTED_FORMATS = {".stl", ".step", ".3mf"}
+SUPPORTED_FORMATS = frozenset({"stl", "step", "3mf"})
+
+# How long the cached model count stays valid
+MODEL_COUNT_TTL_SECONDS = 30
+# Models never change once uploaded, so cached copies only age out for memory
+MODEL_TTL_SECONDS = 600
+
+# Uploads hash and write on their own threads, so a few large uploads
+# cannot use up the anyio pool that serves file downloads
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 2),
+    thread_name_prefix="model-io",
+)
+
+# Statements built once at import; each call only binds parameters
+_COUNT_MODELS = select(func.count(Model.id))
+# Listings select the response fields as plain rows, skipping ORM instances
+_MODEL_LIST_COLUMNS = tuple(getattr(Model, name) for name in ModelResponse.model_fields)
 
 
 class ModelsService:
     """Service for managing uploaded models."""
 
+    def __init__(self):
+        self._count_cache = TTLCache(maxsize=1, ttl=MODEL_COUNT_TTL_SECONDS)
+        # Single models keyed by ID
+        self._model_cache = TTLCache(maxsize=1024, ttl=MODEL_TTL_SECONDS)
+
+    async def count_models(self, db: AsyncSession) -> int:
+        """Count models, served from a short-lived cache when possible."""
+        total = self._count_cache.get(None)
+        if total is not None:
+            return total
+
+        count_result = await db.execute(_COUNT_MODELS)
+        total = count_result.scalar_one()
+
+        self._count_cache.set(None, total)
+        return total
+
     @staticmethod
     def _generate_model_id() -> str:
         """Generate unique model ID."""
-        return f"mdl_{secrets.token_hex(4)}"
+        return f"mdl_{random_hex(4)}"
 
     @staticmethod
     def _get_file_format(filename: str) -> str:
         """Extract file format from filename."""
-        return Path(filename).suffix.lower().lstrip(".")
+        _, dot, extension = filename.rpartition(".")
+        return extension.lower() if dot else ""
 
     async def upload_model(
         self,
@@ -37,90 +77,99 @@ class ModelsService:
         """Upload a new model."""
         # Validate format
         file_format = self._get_file_format(filename)
-        if f".{file_format}" not in SUPPORTED_FORMATS:
+        if file_format not in SUPPORTED_FORMATS:
             raise UnsupportedFormatError(filename, f".{file_format}")
 
         # Generate model ID
         model_id = self._generate_model_id()
 
-        # Save file
-        storage_path, size_bytes, checksum = storage_service.save_model(
-            model_id, file, filename
+        # Save file (blocking I/O and hashing run on the upload pool)
+        storage_path, size_bytes, checksum = await asyncio.get_running_loop().run_in_executor(
+            _IO_POOL, storage_service.save_model, model_id, file, filename
         )
 
         # Create database record
-        model = Model(
-            id=model_id,
-            filename=original_name or filename,
-            format=file_format,
-            size_bytes=size_bytes,
-            checksum_sha256=checksum,
-            storage_path=storage_path,
-        )
-
-        db.add(model)
+        model = await insert_returning(db, Model, {
+            "id": model_id,
+            "filename": original_name or filename,
+            "format": file_format,
+            "size_bytes": size_bytes,
+            "checksum_sha256": checksum,
+            "storage_path": storage_path,
+        })
         await db.commit()
-        await db.refresh(model)
-
-        return ModelResponse(
-            id=model.id,
-            filename=model.filename,
-            format=model.format,
-            size_bytes=model.size_bytes,
-            uploaded_at=model.uploaded_at,
-            checksum_sha256=model.checksum_sha256,
-            storage_path=model.storage_path,
-        )
+        self._count_cache.clear()
+
+        return ModelResponse.model_validate(model)
 
     async def get_model(self, db: AsyncSession, model_id: str) -> ModelResponse:
-        """Get model by ID."""
-        result = await db.execute(select(Model).where(Model.id == model_id))
-        model = result.scalar_one_or_none()
+        """Get model by ID, served from a cache when possible."""
+        cached = self._model_cache.get(model_id)
+        if cached is not None:
+            return cached
+
+        model = await db.get(Model, model_id)
 
         if not model:
             raise ModelNotFoundError(model_id)
 
-        return ModelResponse(
-            id=model.id,
-            filename=model.filename,
-            format=model.format,
-            size_bytes=model.size_bytes,
-            uploaded_at=model.uploaded_at,
-            checksum_sha256=model.checksum_sha256,
-            storage_path=model.storage_path,
-        )
+        response = ModelResponse.model_validate(model)
+        self._model_cache.set(model_id, response)
+        return response
 
     async def list_models(
         self,
         db: AsyncSession,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        exact: bool = False,
     ) -> ModelListResponse:
-        """List all models."""
-        # Get total count
-        count_result = await db.execute(select(func.count(Model.id)))
-        total = count_result.scalar_one()
-
-        # Get models
-        result = await db.execute(
-            select(Model).order_by(Model.uploaded_at.desc()).limit(limit).offset(offset)
+        """
+        List all models, newest first.
+
+        Pass the ``next_cursor`` of a previous page as ``cursor`` to continue
+        with keyset pagination instead of an OFFSET scan. Unless ``exact`` is
+        set, the total of a large PostgreSQL table is an estimate.
+        """
+        total = self._count_cache.get(None)
+        if total is None and not exact:
+            total = await estimated_row_count(db, Model)
+
+        query = (
+            select(*_MODEL_LIST_COLUMNS)
+            .order_by(Model.uploaded_at.desc(), Model.id.desc())
+            .limit(limit)
         )
-        models = result.scalars().all()
-
-        items = [
-            ModelResponse(
-                id=m.id,
-                filename=m.filename,
-                format=m.format,
-                size_bytes=m.size_bytes,
-                uploaded_at=m.uploaded_at,
-                checksum_sha256=m.checksum_sha256,
-                storage_path=m.storage_path,
-            )
-            for m in models
-        ]
-
-        return ModelListResponse(items=items, total=total)
+        if cursor:
+            query = query.where(after_cursor(Model.uploaded_at, Model.id, cursor))
+        else:
+            query = query.offset(offset)
+
+        # Without a cursor the window sees every row, so an uncached total
+        # can ride along on the page query instead of a separate COUNT
+        windowed = total is None and not cursor
+        if windowed:
+            query = query.add_columns(func.count().over().label("total"))
+
+        models = []
+        async for row in iter_page_rows(db, query, limit):
+            if windowed and not models:
+                total = row.total
+                self._count_cache.set(None, total)
+            models.append(row._mapping)
+
+        if total is None:
+            # Cursor pages and pages past the end still need a COUNT
+            total = await self.count_models(db)
+
+        items = MODEL_LIST_ADAPTER.validate_python(models)
+
+        next_cursor = None
+        if len(models) == limit:
+            next_cursor = encode_cursor(models[-1]["uploaded_at"], models[-1]["id"])
+
+        return ModelListResponse(items=items, total=total, next_cursor=next_cursor)
 
 
 models_service = ModelsService()
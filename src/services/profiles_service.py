@@ -1,8 +1,8 @@
 """Profile management service."""
 
-import secrets
-from typing import Optional
-from sqlalchemy import select, func
+import re
+from typing import Any, Dict, List, Optional
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.db_models import Profile
 from ..models.schemas import (
@@ -11,37 +11,88 @@ from ..models.schemas import (
     ProfileResponse,
     ProfileListResponse,
     ProfileDeleteResponse,
+    ProfileBatchResponse,
+    ProfileListItem,
+    PROFILE_LIST_ADAPTER,
+    PROFILE_BATCH_ADAPTER,
 )
-from ..core.errors import ProfileNotFoundError
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..database import estimated_row_count, insert_new_returning, insert_many_new_returning
+from ..core.errors import ProfileIdConflictError, ProfileNotFoundError
+from ..core.pagination import encode_cursor, after_cursor, iter_page_rows
+from ..core.ids import random_hex
+
+
+# How long cached profile counts and list pages stay valid; both are
+# also dropped whenever this process changes a profile
+PROFILE_COUNT_TTL_SECONDS = 30
+PROFILE_PAGE_TTL_SECONDS = 60
+PROFILE_TTL_SECONDS = 60
+
+# Fresh suffixes tried when a generated profile ID is already taken
+PROFILE_ID_ATTEMPTS = 5
+
+# Anything but letters, digits and underscores is dropped from ID slugs
+_NON_SLUG_CHARS = re.compile(r"\W+")
+
+# Statements built once at import; each call only binds parameters
+_DELETE_PROFILE_BY_ID = (
+    delete(Profile).where(Profile.id == bindparam("id")).returning(Profile.id)
+)
+_COUNT_PROFILES = select(func.count(Profile.id))
+# Listings select just the fields they return (no settings_overrides) as
+# plain rows, skipping ORM instances and the identity map
+_PROFILE_LIST_COLUMNS = tuple(getattr(Profile, name) for name in ProfileListItem.model_fields)
+_COUNT_PROFILES_BY_SOURCE = _COUNT_PROFILES.where(Profile.source == bindparam("source"))
 
 
 class ProfilesService:
     """Service for managing slicing profiles."""
 
+    def __init__(self):
+        # Profile counts keyed by source filter (None = all profiles)
+        self._count_cache = TTLCache(maxsize=16, ttl=PROFILE_COUNT_TTL_SECONDS)
+        # List pages keyed by (source, limit, offset, cursor)
+        self._page_cache = TTLCache(maxsize=128, ttl=PROFILE_PAGE_TTL_SECONDS)
+        # Single profiles keyed by ID
+        self._profile_cache = TTLCache(maxsize=1024, ttl=PROFILE_TTL_SECONDS)
+
+    def invalidate_counts(self):
+        """Drop cached profile counts and pages after profiles are added or removed."""
+        self._count_cache.clear()
+        self._page_cache.clear()
+
+    async def count_profiles(
+        self,
+        db: AsyncSession,
+        source: Optional[str] = None,
+    ) -> int:
+        """Count profiles, served from a short-lived cache when possible."""
+        total = self._count_cache.get(source)
+        if total is not None:
+            return total
+
+        if source:
+            count_result = await db.execute(_COUNT_PROFILES_BY_SOURCE, {"source": source})
+        else:
+            count_result = await db.execute(_COUNT_PROFILES)
+        total = count_result.scalar_one()
+
+        self._count_cache.set(source, total)
+        return total
+
     @staticmethod
     def _generate_profile_id(name: str) -> str:
         """Generate profile ID from name."""
         # Create a slug-like ID from name
-        slug = name.lower().replace(" ", "_").replace("@", "")
-        slug = "".join(c for c in slug if c.isalnum() or c == "_")
-        return f"prof_{slug}_{secrets.token_hex(2)}"
+        slug = _NON_SLUG_CHARS.sub("", name.lower().replace(" ", "_"))
+        return f"prof_{slug}_{random_hex(4)}"
 
     @staticmethod
     def _profile_to_response(profile: Profile) -> ProfileResponse:
         """Convert Profile model to response."""
-        return ProfileResponse(
-            id=profile.id,
-            name=profile.name,
-            description=profile.description,
-            source=profile.source,
-            vendor=profile.vendor,
-            machine_id=profile.machine_id,
-            process_id=profile.process_id,
-            filament_id=profile.filament_id,
-            settings_overrides=profile.settings_overrides,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        return ProfileResponse.model_validate(profile)
 
     async def create_profile(
         self,
@@ -49,39 +100,86 @@ class ProfilesService:
         profile_data: ProfileCreate,
     ) -> ProfileResponse:
         """Create a new profile."""
-        profile_id = self._generate_profile_id(profile_data.name)
-
-        profile = Profile(
-            id=profile_id,
-            name=profile_data.name,
-            description=profile_data.description,
-            source=profile_data.source,
-            vendor=profile_data.vendor,
-            machine_id=profile_data.machine_id,
-            process_id=profile_data.process_id,
-            filament_id=profile_data.filament_id,
-            settings_overrides=profile_data.settings_overrides,
-        )
+        values = profile_data.model_dump()
+
+        # ON CONFLICT DO NOTHING turns an ID collision into an empty
+        # RETURNING, so only an actual collision costs another round-trip
+        for _ in range(PROFILE_ID_ATTEMPTS):
+            profile = await insert_new_returning(db, Profile, {
+                "id": self._generate_profile_id(profile_data.name),
+                **values,
+            })
+            if profile is not None:
+                break
+        else:
+            raise ProfileIdConflictError(profile_data.name)
 
-        db.add(profile)
         await db.commit()
-        await db.refresh(profile)
+        self.invalidate_counts()
 
         return self._profile_to_response(profile)
 
+    async def create_profiles(
+        self,
+        db: AsyncSession,
+        profiles_data: List[ProfileCreate],
+    ) -> ProfileBatchResponse:
+        """Create several profiles in one transaction, batching the INSERTs."""
+        pending: Dict[int, Dict[str, Any]] = {
+            i: profile_data.model_dump() for i, profile_data in enumerate(profiles_data)
+        }
+        created: Dict[int, Profile] = {}
+
+        # Rows whose ID collided are retried with a fresh suffix
+        for _ in range(PROFILE_ID_ATTEMPTS):
+            ids = {
+                self._generate_profile_id(values["name"]): i
+                for i, values in pending.items()
+            }
+            if len(ids) < len(pending):
+                continue
+            profiles = await insert_many_new_returning(
+                db, Profile, [{"id": profile_id, **pending[i]} for profile_id, i in ids.items()]
+            )
+            for profile in profiles:
+                i = ids[profile.id]
+                created[i] = profile
+                del pending[i]
+            if not pending:
+                break
+        else:
+            await db.rollback()
+            raise ProfileIdConflictError(next(iter(pending.values()))["name"])
+
+        await db.commit()
+        self.invalidate_counts()
+
+        return ProfileBatchResponse(
+            items=PROFILE_BATCH_ADAPTER.validate_python(
+                [created[i] for i in range(len(profiles_data))], from_attributes=True
+            )
+        )
+
     async def get_profile(
         self,
         db: AsyncSession,
         profile_id: str,
     ) -> ProfileResponse:
-        """Get profile by ID."""
-        result = await db.execute(select(Profile).where(Profile.id == profile_id))
-        profile = result.scalar_one_or_none()
+        """Get profile by ID, served from a short-lived cache when enabled."""
+        if settings.enable_profile_cache:
+            cached = self._profile_cache.get(profile_id)
+            if cached is not None:
+                return cached
+
+        profile = await db.get(Profile, profile_id)
 
         if not profile:
             raise ProfileNotFoundError(profile_id)
 
-        return self._profile_to_response(profile)
+        response = self._profile_to_response(profile)
+        if settings.enable_profile_cache:
+            self._profile_cache.set(profile_id, response)
+        return response
 
     async def list_profiles(
         self,
@@ -89,28 +187,64 @@ class ProfilesService:
         source: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        exact: bool = False,
     ) -> ProfileListResponse:
-        """List profiles."""
-        query = select(Profile)
+        """
+        List profiles, newest first.
+
+        Pass the ``next_cursor`` of a previous page as ``cursor`` to continue
+        with keyset pagination instead of an OFFSET scan. Pages are served
+        from a short-lived cache when possible. Unless ``exact`` is set, the
+        unfiltered total of a large PostgreSQL table is an estimate.
+        """
+        page_key = (source, limit, offset, cursor, exact)
+        page = self._page_cache.get(page_key)
+        if page is not None:
+            return page
+
+        query = select(*_PROFILE_LIST_COLUMNS)
 
         if source:
             query = query.where(Profile.source == source)
 
-        # Get total count
-        count_query = select(func.count(Profile.id))
-        if source:
-            count_query = count_query.where(Profile.source == source)
-        count_result = await db.execute(count_query)
-        total = count_result.scalar_one()
+        total = self._count_cache.get(source)
+        if total is None and not exact and not source:
+            total = await estimated_row_count(db, Profile)
 
         # Get profiles
-        query = query.order_by(Profile.created_at.desc()).limit(limit).offset(offset)
-        result = await db.execute(query)
-        profiles = result.scalars().all()
+        query = query.order_by(Profile.created_at.desc(), Profile.id.desc()).limit(limit)
+        if cursor:
+            query = query.where(after_cursor(Profile.created_at, Profile.id, cursor))
+        else:
+            query = query.offset(offset)
 
-        items = [self._profile_to_response(p) for p in profiles]
+        # Without a cursor the window sees every matching row, so an
+        # uncached total can ride along on the page query
+        windowed = total is None and not cursor
+        if windowed:
+            query = query.add_columns(func.count().over().label("total"))
 
-        return ProfileListResponse(items=items, total=total)
+        profiles = []
+        async for row in iter_page_rows(db, query, limit):
+            if windowed and not profiles:
+                total = row.total
+                self._count_cache.set(source, total)
+            profiles.append(row._mapping)
+
+        if total is None:
+            # Cursor pages and pages past the end still need a COUNT
+            total = await self.count_profiles(db, source)
+
+        items = PROFILE_LIST_ADAPTER.validate_python(profiles)
+
+        next_cursor = None
+        if len(profiles) == limit:
+            next_cursor = encode_cursor(profiles[-1]["created_at"], profiles[-1]["id"])
+
+        page = ProfileListResponse(items=items, total=total, next_cursor=next_cursor)
+        self._page_cache.set(page_key, page)
+        return page
 
     async def update_profile(
         self,
@@ -119,19 +253,25 @@ class ProfilesService:
         profile_data: ProfileUpdate,
     ) -> ProfileResponse:
         """Update profile."""
-        result = await db.execute(select(Profile).where(Profile.id == profile_id))
-        profile = result.scalar_one_or_none()
+        update_data = profile_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_profile(db, profile_id)
+
+        # One UPDATE ... RETURNING instead of SELECT, flush and refresh
+        result = await db.scalars(
+            update(Profile)
+            .where(Profile.id == profile_id)
+            .values(**update_data)
+            .returning(Profile)
+        )
+        profile = result.one_or_none()
 
         if not profile:
             raise ProfileNotFoundError(profile_id)
 
-        # Update fields
-        update_data = profile_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(profile, field, value)
-
         await db.commit()
-        await db.refresh(profile)
+        self._page_cache.clear()
+        self._profile_cache.pop(profile_id)
 
         return self._profile_to_response(profile)
 
@@ -141,14 +281,13 @@ class ProfilesService:
         profile_id: str,
     ) -> ProfileDeleteResponse:
         """Delete profile."""
-        result = await db.execute(select(Profile).where(Profile.id == profile_id))
-        profile = result.scalar_one_or_none()
-
-        if not profile:
+        result = await db.execute(_DELETE_PROFILE_BY_ID, {"id": profile_id})
+        if result.scalar_one_or_none() is None:
             raise ProfileNotFoundError(profile_id)
 
-        await db.delete(profile)
         await db.commit()
+        self.invalidate_counts()
+        self._profile_cache.pop(profile_id)
 
         return ProfileDeleteResponse(id=profile_id, deleted=True)
 
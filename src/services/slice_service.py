@@ -1,28 +1,35 @@
 """Slicing service - orchestrates OrcaSlicer CLI calls."""
 
 import asyncio
+import gzip
+import hashlib
 import json
 import math
+import os
 import re
-import secrets
 import shutil
 import subprocess
+import time
 import xml.etree.ElementTree as ET
 import zipfile
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-from sqlalchemy import select
+from typing import Awaitable, BinaryIO, Callable, Optional, Dict, Any, List, Set, Tuple
+import orjson
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.db_models import SliceJob, SliceJobStatus, Model, Profile
 from ..models.schemas import (
     SliceJobCreate,
     SliceJobResponse,
+    SliceJobStatusResponse,
     SliceJobOutput,
     SliceMetadata,
     BoundingBox,
+    ProfileResponse,
 )
+from ..core.cache import TTLCache
 from ..core.config import settings
+from ..database import insert_returning, seconds_ago
 from ..core.errors import (
     SliceJobNotFoundError,
     ModelNotFoundError,
@@ -31,21 +38,260 @@ from ..core.errors import (
     OrcaCliNotFoundError,
 )
 from ..core.logging import logger
+from ..core.ids import random_hex
+from .profiles_service import profiles_service
 from .storage_service import storage_service
 
 
+TERMINAL_STATUSES = frozenset({SliceJobStatus.COMPLETED.value, SliceJobStatus.FAILED.value})
+
+# How long responses for finished (immutable) jobs are kept in memory
+TERMINAL_JOB_CACHE_TTL_SECONDS = 60
+
+# Prefix of output file URLs in job responses
+_FILES_BASE_URL = f"http://localhost:{settings.port}/files/"  # TODO: Make configurable
+
+# Column lookups behind the polling endpoints, built once rather than per call
+_SELECT_JOB_STATUS = select(SliceJob.status).where(SliceJob.id == bindparam("job_id"))
+_SELECT_JOB_PROGRESS = (
+    select(SliceJob.status, SliceJob.progress_percent, SliceJob.finished_at)
+    .where(SliceJob.id == bindparam("job_id"))
+)
+
+# Rendered settings files, keyed by a digest of their inputs
+SETTINGS_FILE_CACHE_TTL_SECONDS = 3600
+
+# Idle dispatchers re-check the queue this often, picking up jobs queued by
+# other processes (jobs queued here wake them immediately)
+DISPATCH_POLL_INTERVAL_SECONDS = 5.0
+
+# Time allowed on top of the slice timeout to prepare and finish a job;
+# a job running for longer than both has lost its worker
+STALE_JOB_GRACE_SECONDS = 600
+# Idle dispatchers look for such jobs at most this often
+STALE_JOB_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Only the end of OrcaSlicer's output is kept for logs and error details
+SUBPROCESS_OUTPUT_TAIL_BYTES = 16 * 1024
+SUBPROCESS_READ_SIZE = 4096
+
+# Progress reported by OrcaSlicer ("percent=NN", "NN%" or "NN =>") is stored
+# when it moves this much, or after this long, whichever comes first
+_PROGRESS_RE = re.compile(rb"percent=(\d{1,3})|(\d{1,3})\s*(?:%|=>)")
+PROGRESS_MIN_STEP_PERCENT = 5
+PROGRESS_MIN_INTERVAL_SECONDS = 2.0
+
+# OrcaSlicer writes its summary comments in the G-code header and just
+# before the trailing config block; only these ends are searched
+GCODE_HEAD_BYTES = 64 * 1024
+GCODE_TAIL_BYTES = 256 * 1024
+# Read size for the layer-counting pass over the whole file, only needed when
+# the header carries no layer total
+GCODE_SCAN_CHUNK_SIZE = 1024 * 1024
+
+# All summary comments in one alternation, so the buffer is scanned once:
+#   "; total estimated time: 1h 16m 56s"
+#   "; model printing time: 1h 15m 23s ;"
+#   "; first layer printing time = 4m 23s"
+#   "; max_z_height: 35.4"
+#   "; total layer number: 177"
+_GCODE_METADATA_RE = re.compile(
+    rb"total estimated time:\s+(?P<total>[0-9hms\s]+)"
+    rb"|model printing time:\s+(?P<model>[0-9hms\s]+);"
+    rb"|first layer printing time.*?=\s+(?P<first_layer>[0-9hms\s]+)"
+    rb"|max_z_height:\s+(?P<max_z>[0-9.]+)"
+    rb"|total layer number:\s+(?P<layers>\d+)"
+)
+_GCODE_LAYER_COMMENT_RE = re.compile(rb";\s*layer\s+\d+", re.IGNORECASE)
+
+# Metadata keys filled from the time groups of _GCODE_METADATA_RE
+_GCODE_TIME_FIELDS = {
+    "total": "estimated_print_time_seconds",
+    "model": "model_print_time_seconds",
+    "first_layer": "first_layer_print_time_seconds",
+}
+
+
+# Settings that should be string representations of numbers
+_NUMERIC_STRING_SETTINGS = frozenset({
+    "layer_height",
+    "initial_layer_print_height",
+    "line_width",
+    "inner_wall_line_width",
+    "outer_wall_line_width",
+    "top_surface_line_width",
+    "sparse_infill_line_width",
+    "support_line_width",
+    "first_layer_extrusion_width",
+    "min_layer_height",
+    "max_layer_height",
+})
+
+# Settings that should be percent strings (e.g., "25%")
+_PERCENT_SETTINGS = frozenset({
+    "sparse_infill_density",
+    "infill_density",  # Alias - will be converted to sparse_infill_density
+    "internal_bridge_density",
+    "skin_infill_density",
+    "skeleton_infill_density",
+})
+
+# Settings that should be "0" or "1" strings for booleans
+_BOOL_STRING_SETTINGS = frozenset({
+    "enable_support",
+    "detect_thin_wall",
+    "only_one_wall_top",
+    "spiral_mode",
+    "overhang_reverse",
+})
+
+
+def _to_numeric_string(value: Any) -> Any:
+    """Convert numeric values to strings."""
+    if isinstance(value, (int, float)):
+        return str(value)
+    return value
+
+
+def _to_percent_string(value: Any) -> Any:
+    """Convert percent values, adding % if missing."""
+    if isinstance(value, (int, float)):
+        return f"{value}%"
+    if isinstance(value, str) and not value.endswith("%"):
+        return f"{value}%"
+    return value
+
+
+def _to_bool_string(value: Any) -> Any:
+    """Convert booleans to "0" or "1" strings."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return value
+
+
+def _unchanged(value: Any) -> Any:
+    """Pass values of other settings through as-is."""
+    return value
+
+
+# CLI path, then the data directory if provided. The directory should contain
+# machine/, process/, and filament/ subdirectories with profile JSONs.
+_ORCA_COMMAND_PREFIX = (
+    (settings.orca_cli_path, "--datadir", settings.orca_datadir)
+    if settings.orca_datadir
+    else (settings.orca_cli_path,)
+)
+
+# One lookup per setting instead of up to three membership tests
+_SETTING_CONVERTERS = {
+    **dict.fromkeys(_NUMERIC_STRING_SETTINGS, _to_numeric_string),
+    **dict.fromkeys(_PERCENT_SETTINGS, _to_percent_string),
+    **dict.fromkeys(_BOOL_STRING_SETTINGS, _to_bool_string),
+}
+
+
+class _PipeReaderProtocol(asyncio.StreamReaderProtocol):
+    """Stream reader protocol that lets the pipe close at EOF.
+
+    StreamReaderProtocol asks to keep the transport open for writing after
+    EOF, which uvloop honours for read-only pipes, leaking them.
+    """
+
+    def eof_received(self) -> bool:
+        super().eof_received()
+        return False
+
+
 class SliceService:
     """Service for managing slice jobs and OrcaSlicer CLI integration."""
 
+    def __init__(self):
+        # Per-job status subscribers (in-process only)
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        # Responses of completed/failed jobs, which no longer change
+        self._terminal_jobs = TTLCache(maxsize=1024, ttl=TERMINAL_JOB_CACHE_TTL_SECONDS)
+        # Jobs reusing a profile with the same overrides share one rendering
+        self._settings_files = TTLCache(maxsize=256, ttl=SETTINGS_FILE_CACHE_TTL_SECONDS)
+        # Set once the OrcaSlicer CLI has been seen on disk
+        self._orca_cli_found = False
+        # Workers claiming queued jobs from the database, one job each
+        self._dispatchers: List[asyncio.Task] = []
+        # Jobs whose outputs are being collected, after their subprocess exited
+        self._finishing: Set[asyncio.Task] = set()
+        self._finish_slots = asyncio.Semaphore(1)
+        # Set when a job is queued by this process
+        self._jobs_queued = asyncio.Event()
+        # When abandoned jobs were last looked for
+        self._stale_swept_at = 0.0
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Subscribe to status transitions of a job.
+
+        Returns a queue receiving one event dict per transition. Callers must
+        release it with ``unsubscribe`` when done.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        """Remove a subscriber queue for a job."""
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+
+    def _publish(self, job_id: str, status: SliceJobStatus, progress_percent: Optional[int] = None):
+        """Notify subscribers of a job status transition."""
+        queues = self._subscribers.get(job_id)
+        if not queues:
+            return
+        event = {
+            "id": job_id,
+            "status": status.value,
+            "progress_percent": progress_percent,
+        }
+        for queue in queues:
+            queue.put_nowait(event)
+
     @staticmethod
     def _generate_job_id() -> str:
         """Generate unique job ID."""
-        return f"job_{secrets.token_hex(4)}"
+        return f"job_{random_hex(4)}"
 
-    @staticmethod
-    def _check_orca_cli() -> bool:
-        """Check if OrcaSlicer CLI is available."""
-        return Path(settings.orca_cli_path).exists()
+    def _check_orca_cli(self) -> bool:
+        """Check if OrcaSlicer CLI is available.
+
+        Only a positive result is remembered, so a CLI installed after
+        startup is still picked up; if it later disappears, the subprocess
+        launch fails the job instead.
+        """
+        if not self._orca_cli_found:
+            self._orca_cli_found = os.path.exists(settings.orca_cli_path)
+        return self._orca_cli_found
+
+    async def warm_up(self):
+        """Run ``orca --version`` once so the first job starts warm.
+
+        The OrcaSlicer CLI has no persistent or batch mode, so every job is
+        a fresh process; loading its binary and shared libraries into the
+        page cache at startup keeps that cold-start cost off the first job.
+        """
+        if not self._check_orca_cli():
+            return
+        try:
+            await asyncio.to_thread(
+                subprocess.run,
+                [settings.orca_cli_path, "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"OrcaSlicer warm-up failed: {e}")
 
     async def create_slice_job(
         self,
@@ -53,40 +299,34 @@ class SliceService:
         job_data: SliceJobCreate,
     ) -> SliceJobResponse:
         """Create a new slice job."""
-        # Validate model exists
-        model_result = await db.execute(
-            select(Model).where(Model.id == job_data.model_id)
+        # Validate model and profile exist, in one round trip
+        result = await db.execute(
+            select(
+                select(Model.id).where(Model.id == job_data.model_id).exists(),
+                select(Profile.id).where(Profile.id == job_data.profile_id).exists(),
+            )
         )
-        model = model_result.scalar_one_or_none()
-        if not model:
+        model_exists, profile_exists = result.one()
+        if not model_exists:
             raise ModelNotFoundError(job_data.model_id)
-
-        # Validate profile exists
-        profile_result = await db.execute(
-            select(Profile).where(Profile.id == job_data.profile_id)
-        )
-        profile = profile_result.scalar_one_or_none()
-        if not profile:
+        if not profile_exists:
             raise ProfileNotFoundError(job_data.profile_id)
 
         # Create job
         job_id = self._generate_job_id()
-        job = SliceJob(
-            id=job_id,
-            model_id=job_data.model_id,
-            profile_id=job_data.profile_id,
-            status=SliceJobStatus.QUEUED,
-            overrides=job_data.overrides,
-            output_options=job_data.output_options.model_dump() if job_data.output_options else {},
-            job_metadata=job_data.metadata,
-        )
-
-        db.add(job)
+        job = await insert_returning(db, SliceJob, {
+            "id": job_id,
+            "model_id": job_data.model_id,
+            "profile_id": job_data.profile_id,
+            "status": SliceJobStatus.QUEUED,
+            "overrides": job_data.overrides,
+            "output_options": job_data.output_options.model_dump() if job_data.output_options else {},
+            "job_metadata": job_data.metadata,
+        })
         await db.commit()
-        await db.refresh(job)
 
-        # Start background slicing task
-        asyncio.create_task(self._process_slice_job(job_id, model.storage_path, profile))
+        # Wake an idle dispatcher
+        self._jobs_queued.set()
 
         return self._job_to_response(job)
 
@@ -96,24 +336,82 @@ class SliceService:
         job_id: str,
     ) -> SliceJobResponse:
         """Get slice job by ID."""
-        result = await db.execute(select(SliceJob).where(SliceJob.id == job_id))
-        job = result.scalar_one_or_none()
+        cached = self._terminal_jobs.get(job_id)
+        if cached is not None:
+            return cached
+
+        job = await db.get(SliceJob, job_id)
 
         if not job:
             raise SliceJobNotFoundError(job_id)
 
-        return self._job_to_response(job)
+        response = self._job_to_response(job)
+        if response.status in TERMINAL_STATUSES:
+            self._terminal_jobs.set(job_id, response)
+
+        return response
+
+    async def get_job_status(
+        self,
+        db: AsyncSession,
+        job_id: str,
+    ) -> str:
+        """
+        Get only the status of a slice job.
+
+        Used by the download routes, which derive output paths from the job
+        ID and do not need the full response model.
+        """
+        cached = self._terminal_jobs.get(job_id)
+        if cached is not None:
+            return cached.status
+
+        result = await db.execute(_SELECT_JOB_STATUS, {"job_id": job_id})
+        job_status = result.scalar_one_or_none()
+
+        if job_status is None:
+            raise SliceJobNotFoundError(job_id)
+
+        return job_status.value
+
+    async def get_job_progress(
+        self,
+        db: AsyncSession,
+        job_id: str,
+    ) -> SliceJobStatusResponse:
+        """Get the status and progress of a slice job, without its outputs."""
+        cached = self._terminal_jobs.get(job_id)
+        if cached is not None:
+            return SliceJobStatusResponse(
+                id=cached.id,
+                status=cached.status,
+                progress_percent=cached.progress_percent,
+                finished_at=cached.finished_at,
+            )
+
+        result = await db.execute(_SELECT_JOB_PROGRESS, {"job_id": job_id})
+        row = result.one_or_none()
+
+        if row is None:
+            raise SliceJobNotFoundError(job_id)
+
+        return SliceJobStatusResponse(
+            id=job_id,
+            status=row.status.value,
+            progress_percent=row.progress_percent,
+            finished_at=row.finished_at,
+        )
 
     def _job_to_response(self, job: SliceJob) -> SliceJobResponse:
         """Convert SliceJob to response."""
         output = None
         if job.status == SliceJobStatus.COMPLETED and job.output_metadata:
             # Build output URLs
-            base_url = f"http://localhost:{settings.port}"  # TODO: Make configurable
+            job_files_url = _FILES_BASE_URL + job.id
             output = SliceJobOutput(
-                gcode_url=f"{base_url}/files/{job.id}/output.gcode" if job.gcode_path else None,
-                project_3mf_url=f"{base_url}/files/{job.id}/project.3mf" if job.project_3mf_path else None,
-                metadata=SliceMetadata(**job.output_metadata) if job.output_metadata else None,
+                gcode_url=job_files_url + "/output.gcode" if job.gcode_path else None,
+                project_3mf_url=job_files_url + "/project.3mf" if job.project_3mf_path else None,
+                metadata=SliceMetadata.model_validate(job.output_metadata),
             )
 
         return SliceJobResponse(
@@ -131,113 +429,276 @@ class SliceService:
             error_message=job.error_message,
         )
 
+    def start_dispatchers(self):
+        """Start the workers that run queued slice jobs.
+
+        Each slice is a CPU- and memory-heavy subprocess, so the number of
+        workers caps how many run at once. Jobs live in the database until
+        claimed, so they survive restarts and can be shared between processes;
+        jobs of a worker that died are queued again once their lease (the
+        slice timeout plus a grace period) runs out.
+        """
+        count = settings.max_concurrent_slices or os.cpu_count() or 1
+        self._finish_slots = asyncio.Semaphore(count)
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(count)]
+
+    async def stop_dispatchers(self):
+        """Cancel the dispatcher workers and let jobs being finished complete."""
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        await asyncio.gather(*self._finishing, return_exceptions=True)
+
+    async def _dispatch(self):
+        """Claim and process queued jobs, oldest first, until cancelled."""
+        from ..database import async_session_maker
+
+        while True:
+            # Cleared before claiming, so a job queued meanwhile is not missed
+            self._jobs_queued.clear()
+            try:
+                async with async_session_maker() as db:
+                    job = await self._claim_next_job(db)
+                    if job is not None:
+                        await self._process_slice_job(db, job)
+                        continue
+            except Exception:
+                logger.exception("Slice job dispatcher failed to claim a job")
+
+            try:
+                await asyncio.wait_for(self._jobs_queued.wait(), DISPATCH_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                # Reclaim jobs of workers that died while this one idles
+                if time.monotonic() - self._stale_swept_at >= STALE_JOB_SWEEP_INTERVAL_SECONDS:
+                    try:
+                        await self.requeue_stale_jobs()
+                    except Exception:
+                        logger.exception("Slice job dispatcher failed to requeue stale jobs")
+
+    @staticmethod
+    async def _claim_next_job(db: AsyncSession) -> Optional[SliceJob]:
+        """Mark the oldest queued job running and return it, if there is one.
+
+        The status check in the UPDATE makes the claim atomic, and on
+        PostgreSQL ``SKIP LOCKED`` lets concurrent workers pass over each
+        other's rows instead of blocking.
+        """
+        next_job = (
+            select(SliceJob.id)
+            .where(SliceJob.status == SliceJobStatus.QUEUED)
+            .order_by(SliceJob.queued_at, SliceJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.scalars(
+            update(SliceJob)
+            .where(SliceJob.id == next_job, SliceJob.status == SliceJobStatus.QUEUED)
+            .values(status=SliceJobStatus.RUNNING, started_at=func.now())
+            .returning(SliceJob)
+        )
+        job = result.one_or_none()
+        await db.commit()
+        return job
+
     async def _process_slice_job(
         self,
-        job_id: str,
-        model_path: str,
-        profile: Profile,
+        db: AsyncSession,
+        job: SliceJob,
     ):
-        """Process a slice job in the background."""
-        from ..database import async_session_maker
+        """Process a claimed slice job."""
+        job_id = job.id
 
-        async with async_session_maker() as db:
-            try:
-                # Update job status to running
-                result = await db.execute(select(SliceJob).where(SliceJob.id == job_id))
-                job = result.scalar_one()
-                job.status = SliceJobStatus.RUNNING
-                job.started_at = datetime.utcnow()
+        try:
+            self._publish(job_id, SliceJobStatus.RUNNING, job.progress_percent)
+
+            logger.info(f"Starting slice job {job_id}", extra={
+                "job_id": job_id,
+                "model_id": job.model_id,
+                "profile_id": job.profile_id,
+            })
+
+            model = await db.get(Model, job.model_id)
+            if not model:
+                raise ModelNotFoundError(job.model_id)
+            # Jobs often share a profile; reuse the profile service's cache
+            profile = await profiles_service.get_profile(db, job.profile_id)
+
+            # Check OrcaSlicer CLI
+            if not self._check_orca_cli():
+                raise OrcaCliNotFoundError(settings.orca_cli_path)
+
+            # Prepare working directory (mkdir can block on slow storage)
+            work_dir = await asyncio.to_thread(storage_service.get_job_work_dir, job_id)
+            output_dir = await asyncio.to_thread(storage_service.get_job_output_dir, job_id)
+            output_options = job.output_options or {}
+
+            # Build OrcaSlicer command
+            cmd = await self._build_orca_command(
+                model.storage_path,
+                work_dir,
+                output_dir,
+                profile,
+                job.overrides or {},
+                output_options,
+            )
+
+            # Execute OrcaSlicer
+            # The full command is only formatted if debug logging is on
+            logger.info("Executing OrcaSlicer for job %s (%d arguments)", job_id, len(cmd))
+            process, stdout_reader, stderr_reader = await self._spawn(cmd, work_dir)
+
+            reported_percent = 0
+            reported_at = time.monotonic()
+
+            async def report_progress(percent: int):
+                nonlocal reported_percent, reported_at
+                # 100 is only stored once outputs are in place
+                percent = min(percent, 99)
+                now = time.monotonic()
+                if percent <= reported_percent or (
+                    percent - reported_percent < PROGRESS_MIN_STEP_PERCENT
+                    and now - reported_at < PROGRESS_MIN_INTERVAL_SECONDS
+                ):
+                    return
+                reported_percent, reported_at = percent, now
+                await db.execute(
+                    update(SliceJob).where(SliceJob.id == job_id).values(progress_percent=percent)
+                )
                 await db.commit()
+                self._publish(job_id, SliceJobStatus.RUNNING, percent)
+
+            # Killing the process closes its pipes, which ends the reads below
+            timed_out = False
+
+            def kill_on_timeout():
+                nonlocal timed_out
+                timed_out = True
+                process.kill()
 
-                logger.info(f"Starting slice job {job_id}", extra={
-                    "job_id": job_id,
-                    "model_id": job.model_id,
-                    "profile_id": job.profile_id,
-                })
-
-                # Check OrcaSlicer CLI
-                if not self._check_orca_cli():
-                    raise OrcaCliNotFoundError(settings.orca_cli_path)
-
-                # Prepare working directory
-                work_dir = storage_service.get_job_work_dir(job_id)
-                output_dir = storage_service.get_job_output_dir(job_id)
-
-                # Build OrcaSlicer command
-                cmd = await self._build_orca_command(
-                    model_path,
-                    work_dir,
-                    output_dir,
-                    profile,
-                    job.overrides or {},
-                    job.output_options or {},
+            timeout = asyncio.get_running_loop().call_later(
+                settings.slice_timeout_seconds, kill_on_timeout
+            )
+            try:
+                stdout, stderr = await asyncio.gather(
+                    self._read_output_tail(stdout_reader, report_progress),
+                    self._read_output_tail(stderr_reader),
+                )
+                # Both pipes are closed, so the process has exited or is about to
+                await asyncio.to_thread(process.wait)
+            finally:
+                timeout.cancel()
+                if process.returncode is None:
+                    # Cancelled or failed while OrcaSlicer was still running;
+                    # don't leave it behind holding a CPU and the work dir.
+                    # A process stuck in uninterruptible I/O only exits once
+                    # that I/O completes, so reap it off the event loop.
+                    process.kill()
+                    await asyncio.to_thread(process.wait)
+
+            if timed_out:
+                raise SlicingError(
+                    f"OrcaSlicer did not finish within {settings.slice_timeout_seconds} seconds"
                 )
 
-                # Execute OrcaSlicer
-                logger.info(f"Executing OrcaSlicer: {' '.join(cmd)}")
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(work_dir),
+            stdout_text = stdout.decode(errors="replace")
+            stderr_text = stderr.decode(errors="replace")
+
+            if process.returncode != 0:
+                command = ' '.join(cmd)
+                logger.error(
+                    f"OrcaSlicer failed with exit code {process.returncode}",
+                    extra={
+                        "job_id": job_id,
+                        "exit_code": process.returncode,
+                        "command": command,
+                        "stdout": stdout_text[-500:],
+                        "stderr": stderr_text[-500:],
+                    }
+                )
+                raise SlicingError(
+                    f"OrcaSlicer exited with code {process.returncode}: {stderr_text[-200:].strip()}",
+                    details={
+                        "exit_code": process.returncode,
+                        "stderr": stderr_text,
+                        "stdout": stdout_text,
+                        "command": command,
+                    },
                 )
 
-                stdout, stderr = await process.communicate()
-
-                stdout_text = stdout.decode() if stdout else ""
-                stderr_text = stderr.decode() if stderr else ""
-
-                if process.returncode != 0:
-                    logger.error(
-                        f"OrcaSlicer failed with exit code {process.returncode}",
-                        extra={
-                            "job_id": job_id,
-                            "exit_code": process.returncode,
-                            "command": ' '.join(cmd),
-                            "stdout": stdout_text[:500],
-                            "stderr": stderr_text[:500],
-                        }
-                    )
-                    raise SlicingError(
-                        f"OrcaSlicer exited with code {process.returncode}: {stderr_text[:200]}",
-                        details={
-                            "exit_code": process.returncode,
-                            "stderr": stderr_text,
-                            "stdout": stdout_text,
-                            "command": ' '.join(cmd),
-                        },
-                    )
-
-                logger.info(f"OrcaSlicer completed successfully", extra={
-                    "job_id": job_id,
-                    "stdout": stdout_text[:200] if stdout_text else "No output",
-                })
+            logger.info(f"OrcaSlicer completed successfully", extra={
+                "job_id": job_id,
+                "stdout": stdout_text[-200:] if stdout_text else "No output",
+            })
 
-                # Parse outputs and generate metadata
-                metadata = await self._generate_metadata(output_dir, job.output_options or {})
+            # Collecting outputs overlaps the next job's slicing; the
+            # dispatcher only waits here when that stage is already full
+            await self._finish_slots.acquire()
+            task = asyncio.create_task(
+                self._finish_slice_job(job_id, model.storage_path, output_dir, output_options)
+            )
+            self._finishing.add(task)
+            task.add_done_callback(self._finished)
 
-                # Update job with results
-                await db.refresh(job)
-                job.status = SliceJobStatus.COMPLETED
-                job.finished_at = datetime.utcnow()
-                job.progress_percent = 100
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back rather than leave it running
+            await self._requeue_slice_job(db, job_id)
+            raise
+        except Exception as e:
+            logger.exception(f"Slice job {job_id} failed")
+            await self._fail_slice_job(db, job_id, e)
 
-                # Find generated gcode file (OrcaSlicer names it based on input file)
-                if (job.output_options or {}).get("gcode", True):
-                    gcode_files = list(output_dir.glob("*.gcode"))
-                    if gcode_files:
-                        # Rename to standardized name for easier access
-                        gcode_output = output_dir / "output.gcode"
-                        gcode_files[0].rename(gcode_output)
-                        job.gcode_path = str(gcode_output)
-                    else:
-                        logger.warning(f"No gcode file found in {output_dir}")
+    def _finished(self, task: asyncio.Task):
+        """Release the finishing slot of a completed finishing task."""
+        self._finishing.discard(task)
+        self._finish_slots.release()
 
-                if (job.output_options or {}).get("project_3mf", False):
-                    job.project_3mf_path = str(output_dir / "project.3mf")
+    async def _finish_slice_job(
+        self,
+        job_id: str,
+        model_path: str,
+        output_dir: Path,
+        output_options: Dict[str, Any],
+    ):
+        """Collect a sliced job's outputs and mark it completed."""
+        from ..database import async_session_maker
 
-                job.output_metadata = metadata
+        async with async_session_maker() as db:
+            try:
+                # Find generated gcode file (OrcaSlicer names it based on input file)
+                gcode_file = self._find_gcode_file(output_dir, model_path)
+                gcode_path = None
+                if gcode_file is None:
+                    logger.warning(f"No gcode file found in {output_dir}")
+                elif output_options.get("gcode", True):
+                    # Rename to standardized name for easier access
+                    gcode_output = output_dir / "output.gcode"
+                    os.replace(gcode_file, gcode_output)
+                    gcode_file = gcode_output
+                    gcode_path = str(gcode_output)
+                    if settings.precompress_gcode:
+                        await asyncio.to_thread(self._compress_gcode, gcode_output)
+
+                # Parse outputs and generate metadata
+                metadata = await self._generate_metadata(output_dir, gcode_file)
+
+                # Collect the results, then write them in a single UPDATE
+                results: Dict[str, Any] = {
+                    "status": SliceJobStatus.COMPLETED,
+                    "finished_at": func.now(),
+                    "progress_percent": 100,
+                    "output_metadata": metadata,
+                }
+                if gcode_path:
+                    results["gcode_path"] = gcode_path
+
+                if output_options.get("project_3mf", False):
+                    results["project_3mf_path"] = str(output_dir / "project.3mf")
+
+                await db.execute(update(SliceJob).where(SliceJob.id == job_id).values(**results))
                 await db.commit()
+                self._publish(job_id, SliceJobStatus.COMPLETED, 100)
 
                 # Cleanup work directory
                 storage_service.cleanup_work_dir(job_id)
@@ -246,64 +707,201 @@ class SliceService:
 
             except Exception as e:
                 logger.exception(f"Slice job {job_id} failed")
+                await self._fail_slice_job(db, job_id, e)
+
+    async def _fail_slice_job(self, db: AsyncSession, job_id: str, error: Exception):
+        """Mark a job failed, discarding anything left unflushed in the session."""
+        await db.rollback()
+        result = await db.execute(
+            update(SliceJob)
+            .where(SliceJob.id == job_id)
+            .values(
+                status=SliceJobStatus.FAILED,
+                finished_at=func.now(),
+                error_message=str(error),
+                error_details={"error": str(error)},
+            )
+            .returning(SliceJob.progress_percent)
+        )
+        progress_percent = result.scalar_one_or_none()
+        await db.commit()
+        if progress_percent is not None:
+            self._publish(job_id, SliceJobStatus.FAILED, progress_percent)
 
-                # Update job with error
-                result = await db.execute(select(SliceJob).where(SliceJob.id == job_id))
-                job = result.scalar_one_or_none()
-                if job:
-                    job.status = SliceJobStatus.FAILED
-                    job.finished_at = datetime.utcnow()
-                    job.error_message = str(e)
-                    job.error_details = {"error": str(e)}
-                    await db.commit()
+    async def _requeue_slice_job(self, db: AsyncSession, job_id: str):
+        """Put a claimed job back in the queue."""
+        try:
+            await db.rollback()
+            await db.execute(
+                update(SliceJob)
+                .where(SliceJob.id == job_id, SliceJob.status == SliceJobStatus.RUNNING)
+                .values(status=SliceJobStatus.QUEUED, started_at=None, progress_percent=None)
+            )
+            await db.commit()
+        except Exception:
+            # It is picked up again once its lease runs out
+            logger.exception("Could not requeue slice job %s", job_id)
+            return
+        logger.info("Requeued slice job %s", job_id)
+        self._publish(job_id, SliceJobStatus.QUEUED)
+
+    async def requeue_stale_jobs(self) -> int:
+        """Queue again jobs left running by a worker that crashed or was killed.
+
+        A job counts as abandoned once it has been running longer than the
+        slice timeout plus the time allowed to prepare and finish it, since
+        a live worker would have failed or completed it by then.
+        """
+        from ..database import async_session_maker
+
+        self._stale_swept_at = time.monotonic()
+        cutoff = seconds_ago(settings.slice_timeout_seconds + STALE_JOB_GRACE_SECONDS)
+        async with async_session_maker() as db:
+            result = await db.execute(
+                update(SliceJob)
+                .where(SliceJob.status == SliceJobStatus.RUNNING, SliceJob.started_at < cutoff)
+                .values(status=SliceJobStatus.QUEUED, started_at=None, progress_percent=None)
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning("Requeued %d abandoned slice jobs", result.rowcount)
+            self._jobs_queued.set()
+        return result.rowcount
+
+    @staticmethod
+    async def _spawn(
+        cmd: list[str],
+        cwd: Path,
+    ) -> Tuple[subprocess.Popen, asyncio.StreamReader, asyncio.StreamReader]:
+        """Start a process from a worker thread and attach its pipes to the loop.
+
+        fork/exec of the large OrcaSlicer binary happens off the event loop,
+        so other requests are not stalled while it runs.
+        """
+        process = await asyncio.to_thread(
+            subprocess.Popen,
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(cwd),
+        )
+        loop = asyncio.get_running_loop()
+        stdout_reader = asyncio.StreamReader()
+        stderr_reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: _PipeReaderProtocol(stdout_reader), process.stdout)
+        await loop.connect_read_pipe(lambda: _PipeReaderProtocol(stderr_reader), process.stderr)
+        return process, stdout_reader, stderr_reader
+
+    @staticmethod
+    async def _read_output_tail(
+        stream: asyncio.StreamReader,
+        on_progress: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> bytes:
+        """Drain a subprocess pipe, keeping only its last few kilobytes.
+
+        With ``on_progress``, complete lines are scanned for progress
+        percentages as they arrive, and the latest one in each read is passed
+        to the callback.
+        """
+        tail = bytearray()
+        partial = b""
+        while chunk := await stream.read(SUBPROCESS_READ_SIZE):
+            tail += chunk
+            if len(tail) > SUBPROCESS_OUTPUT_TAIL_BYTES:
+                del tail[:-SUBPROCESS_OUTPUT_TAIL_BYTES]
+
+            if on_progress is not None:
+                data = partial + chunk
+                end = data.rfind(b"\n") + 1
+                partial = data[end:][-SUBPROCESS_READ_SIZE:]
+                percent = None
+                for match in _PROGRESS_RE.finditer(data, 0, end):
+                    percent = int(match.group(1) or match.group(2))
+                if percent is not None:
+                    await on_progress(percent)
+        return bytes(tail)
+
+    @staticmethod
+    def _compress_gcode(gcode_file: Path):
+        """Write a gzip copy of the G-code for clients accepting gzip.
+
+        Compressing once at slice time lets downloads skip per-request
+        compression; the file is renamed into place so it never appears
+        partially written.
+        """
+        gz_file = gcode_file.with_name(gcode_file.name + ".gz")
+        tmp_file = gz_file.with_name(gz_file.name + ".tmp")
+        with open(gcode_file, "rb") as src, gzip.open(tmp_file, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        tmp_file.replace(gz_file)
 
     async def _build_orca_command(
         self,
         model_path: str,
         work_dir: Path,
         output_dir: Path,
-        profile: Profile,
+        profile: ProfileResponse,
         overrides: Dict[str, Any],
         output_options: Dict[str, Any],
     ) -> list[str]:
         """Build OrcaSlicer CLI command."""
-        cmd = [settings.orca_cli_path]
-
-        # Set data directory first if provided
-        # This directory should contain machine/, process/, and filament/ subdirectories with profile JSONs
-        if settings.orca_datadir:
-            cmd.extend(["--datadir", settings.orca_datadir])
-
-        # Set output directory
-        cmd.extend(["--outputdir", str(output_dir)])
+        # Static prefix, then the output directory
+        cmd = [*_ORCA_COMMAND_PREFIX, "--outputdir", str(output_dir)]
 
         # Create settings file with profile and overrides if there are any settings
         if profile.settings_overrides or overrides:
             settings_file = await self._create_settings_file(work_dir, profile, overrides)
             if settings_file:
-                cmd.extend(["--load-settings", str(settings_file)])
+                cmd += ("--load-settings", str(settings_file))
 
         # Add slice flag (0 = slice all plates)
-        cmd.extend(["--slice", "0"])
+        cmd += ("--slice", "0")
 
         # Export 3MF if requested
         if output_options.get("project_3mf", False):
-            cmd.extend(["--export-3mf", str(output_dir / "project.3mf")])
+            cmd += ("--export-3mf", str(output_dir / "project.3mf"))
 
         # Add model input (must be last or near last)
         cmd.append(model_path)
 
-        logger.debug(f"Built OrcaSlicer command: {' '.join(cmd)}")
+        logger.debug("Built OrcaSlicer command: %s", cmd)
 
         return cmd
 
     async def _create_settings_file(
         self,
         work_dir: Path,
-        profile: Profile,
+        profile: ProfileResponse,
         overrides: Dict[str, Any],
     ) -> Optional[Path]:
-        """Create a settings JSON file for OrcaSlicer.
+        """Create a settings JSON file for OrcaSlicer in the job's work directory."""
+        # Keyed on content rather than updated_at, which may not change
+        # between two edits made within the same second
+        try:
+            key = hashlib.blake2b(
+                orjson.dumps(
+                    [profile.name, profile.settings_overrides, overrides],
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                ),
+                digest_size=16,
+            ).digest()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json.dumps still handles
+            key = None
+
+        data = self._settings_files.get(key) if key else None
+        if data is None:
+            data = self._render_settings(profile, overrides)
+            if key:
+                self._settings_files.set(key, data)
+
+        # Write settings to file
+        settings_file = work_dir / "settings.json"
+        await asyncio.to_thread(self._write_settings_file, settings_file, data)
+        return settings_file
+
+    def _render_settings(self, profile: ProfileResponse, overrides: Dict[str, Any]) -> bytes:
+        """Merge profile settings and overrides into OrcaSlicer's JSON format.
 
         OrcaSlicer requires specific metadata fields in the JSON:
         - type: "machine", "process", or "filament"
@@ -336,13 +934,26 @@ class SliceService:
         elif isinstance(settings_data["layer_gcode"], str) and "G92 E0" not in settings_data["layer_gcode"]:
             settings_data["layer_gcode"] = settings_data["layer_gcode"] + "\nG92 E0"
 
-        # Write settings to file
-        settings_file = work_dir / "settings.json"
-        with open(settings_file, "w") as f:
-            json.dump(settings_data, f, indent=2)
+        logger.debug(
+            "Rendered settings with metadata: type=%s, name=%s, from=%s",
+            settings_data.get('type'), settings_data.get('name'), settings_data.get('from'),
+        )
+        try:
+            return orjson.dumps(settings_data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits
+            return json.dumps(settings_data, ensure_ascii=False, separators=(",", ":")).encode()
 
-        logger.debug(f"Created settings file with metadata: type={settings_data.get('type')}, name={settings_data.get('name')}, from={settings_data.get('from')}")
-        return settings_file
+    @staticmethod
+    def _write_settings_file(settings_file: Path, data: bytes):
+        """Write the settings JSON (blocking; run it off the event loop).
+
+        The file is written in one call to a temporary name and renamed into
+        place, so OrcaSlicer never sees it half-written.
+        """
+        tmp_file = settings_file.with_name(settings_file.name + ".tmp")
+        tmp_file.write_bytes(data)
+        tmp_file.replace(settings_file)
 
     def _convert_settings_types(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Convert settings values to OrcaSlicer expected types.
@@ -352,74 +963,39 @@ class SliceService:
         - Percent values should have % suffix (e.g., "25%")
         - Boolean values should be "0" or "1" strings
         """
-        result = settings.copy()
-
-        # Settings that should be string representations of numbers
-        numeric_string_settings = {
-            "layer_height",
-            "initial_layer_print_height",
-            "line_width",
-            "inner_wall_line_width",
-            "outer_wall_line_width",
-            "top_surface_line_width",
-            "sparse_infill_line_width",
-            "support_line_width",
-            "first_layer_extrusion_width",
-            "min_layer_height",
-            "max_layer_height",
-        }
-
-        # Settings that should be percent strings (e.g., "25%")
-        percent_settings = {
-            "sparse_infill_density",
-            "infill_density",  # Alias - will be converted to sparse_infill_density
-            "internal_bridge_density",
-            "skin_infill_density",
-            "skeleton_infill_density",
-        }
-
-        # Settings that should be "0" or "1" strings for booleans
-        bool_string_settings = {
-            "enable_support",
-            "detect_thin_wall",
-            "only_one_wall_top",
-            "spiral_mode",
-            "overhang_reverse",
-        }
-
         # Handle infill_density -> sparse_infill_density alias
-        if "infill_density" in result and "sparse_infill_density" not in result:
-            result["sparse_infill_density"] = result.pop("infill_density")
+        rename = {}
+        if "infill_density" in settings and "sparse_infill_density" not in settings:
+            rename["infill_density"] = "sparse_infill_density"
 
-        for key, value in list(result.items()):
-            if value is None:
-                continue
-
-            # Convert numeric values to strings for specific settings
-            if key in numeric_string_settings:
-                if isinstance(value, (int, float)):
-                    result[key] = str(value)
+        return {
+            rename.get(key, key): (
+                _SETTING_CONVERTERS.get(key, _unchanged)(value) if value is not None else None
+            )
+            for key, value in settings.items()
+        }
 
-            # Convert percent values - add % if missing
-            elif key in percent_settings:
-                if isinstance(value, (int, float)):
-                    result[key] = f"{value}%"
-                elif isinstance(value, str) and not value.endswith("%"):
-                    result[key] = f"{value}%"
+    @staticmethod
+    def _find_gcode_file(output_dir: Path, model_path: str) -> Optional[Path]:
+        """Return the G-code file OrcaSlicer wrote to the output directory.
 
-            # Convert booleans to "0" or "1" strings
-            elif key in bool_string_settings:
-                if isinstance(value, bool):
-                    result[key] = "1" if value else "0"
-                elif isinstance(value, int):
-                    result[key] = str(value)
+        OrcaSlicer names it after the input model, so that name is tried
+        first; the directory is only listed when the naming differs.
+        """
+        expected = output_dir / (Path(model_path).stem + ".gcode")
+        if expected.is_file():
+            return expected
 
-        return result
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".gcode"):
+                    return Path(entry.path)
+        return None
 
     async def _generate_metadata(
         self,
         output_dir: Path,
-        output_options: Dict[str, Any],
+        gcode_file: Optional[Path],
     ) -> Dict[str, Any]:
         """Generate metadata from slice outputs.
 
@@ -430,25 +1006,18 @@ class SliceService:
         metadata: Dict[str, Any] = {}
 
         try:
-            # Find the gcode file
-            gcode_file = output_dir / "output.gcode"
-            if not gcode_file.exists():
-                # Try to find any gcode file
-                gcode_files = list(output_dir.glob("*.gcode"))
-                if gcode_files:
-                    gcode_file = gcode_files[0]
-                else:
-                    logger.warning(f"No gcode file found in {output_dir}")
-                    return metadata
+            if gcode_file is None:
+                return metadata
 
             # Parse gcode metadata
-            gcode_metadata = await self._parse_gcode_metadata(gcode_file)
+            # Both parsers read files; keep that off the event loop
+            gcode_metadata = await asyncio.to_thread(self._parse_gcode_metadata, gcode_file)
             metadata.update(gcode_metadata)
 
             # If 3MF was generated, extract filament data from it
             project_3mf = output_dir / "project.3mf"
             if project_3mf.exists():
-                filament_metadata = await self._parse_3mf_metadata(project_3mf, output_dir)
+                filament_metadata = await asyncio.to_thread(self._parse_3mf_metadata, project_3mf)
                 metadata.update(filament_metadata)
 
             logger.info(f"Extracted metadata: {metadata}")
@@ -458,7 +1027,7 @@ class SliceService:
 
         return metadata
 
-    async def _parse_gcode_metadata(self, gcode_file: Path) -> Dict[str, Any]:
+    def _parse_gcode_metadata(self, gcode_file: Path) -> Dict[str, Any]:
         """Parse metadata from gcode file.
 
         Extracts:
@@ -469,115 +1038,134 @@ class SliceService:
         metadata: Dict[str, Any] = {}
 
         try:
-            with open(gcode_file, 'r', encoding='utf-8') as f:
-                gcode_content = f.read()
-
-            # Extract print times
-            # Format: "; total estimated time: 1h 16m 56s"
-            total_time_match = re.search(r"total estimated time:\s+([0-9hms\s]+)", gcode_content)
-            if total_time_match:
-                total_time_str = total_time_match.group(1).strip()
-                metadata["estimated_print_time_seconds"] = self._time_string_to_seconds(total_time_str)
-
-            # Extract model printing time
-            # Format: "; model printing time: 1h 15m 23s ;"
-            model_time_match = re.search(r"model printing time:\s+([0-9hms\s]+);", gcode_content)
-            if model_time_match:
-                model_time_str = model_time_match.group(1).strip()
-                metadata["model_print_time_seconds"] = self._time_string_to_seconds(model_time_str)
-
-            # Extract first layer printing time
-            # Format: "; first layer printing time = 4m 23s"
-            first_layer_time_match = re.search(r"first layer printing time.*?=\s+([0-9hms\s]+)", gcode_content)
-            if first_layer_time_match:
-                first_layer_time_str = first_layer_time_match.group(1).strip()
-                metadata["first_layer_print_time_seconds"] = self._time_string_to_seconds(first_layer_time_str)
-
-            # Extract max Z height
-            # Format: "; max_z_height: 35.4"
-            max_z_match = re.search(r"max_z_height:\s+([0-9.]+)", gcode_content)
-            if max_z_match:
-                max_z = float(max_z_match.group(1))
-                metadata["bounding_box_mm"] = {"z": max_z}
-
-            # Count layers by counting layer change comments
-            # OrcaSlicer uses "; CHANGE_LAYER" or similar
-            layer_changes = re.findall(r";\s*CHANGE_LAYER", gcode_content)
-            if layer_changes:
-                metadata["layer_count"] = len(layer_changes)
-            else:
-                # Alternative: count "; layer" comments
-                layer_comments = re.findall(r";\s*layer\s+\d+", gcode_content, re.IGNORECASE)
-                if layer_comments:
-                    metadata["layer_count"] = len(layer_comments)
+            with open(gcode_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= GCODE_HEAD_BYTES + GCODE_TAIL_BYTES:
+                    gcode_ends = f.read()
+                else:
+                    head = f.read(GCODE_HEAD_BYTES)
+                    f.seek(size - GCODE_TAIL_BYTES)
+                    gcode_ends = head + b"\n" + f.read()
+
+                # The first occurrence of each comment wins
+                for match in _GCODE_METADATA_RE.finditer(gcode_ends):
+                    group = match.lastgroup
+                    if group == "max_z":
+                        metadata.setdefault("bounding_box_mm", {"z": float(match.group(group))})
+                    elif group == "layers":
+                        metadata.setdefault("layer_count", int(match.group(group)))
+                    else:
+                        field = _GCODE_TIME_FIELDS[group]
+                        if field not in metadata:
+                            time_str = match.group(group).decode().strip()
+                            metadata[field] = self._time_string_to_seconds(time_str)
+
+                # Without a header total, count layer changes across the file
+                if "layer_count" not in metadata:
+                    layer_count = self._count_gcode_layers(f)
+                    if layer_count:
+                        metadata["layer_count"] = layer_count
 
-            logger.debug(f"Extracted gcode metadata: {metadata}")
+            logger.debug("Extracted gcode metadata: %s", metadata)
 
         except Exception as e:
             logger.error(f"Failed to parse gcode metadata: {e}", exc_info=True)
 
         return metadata
 
-    async def _parse_3mf_metadata(self, project_3mf: Path, output_dir: Path) -> Dict[str, Any]:
+    @staticmethod
+    def _count_gcode_layers(f: BinaryIO) -> int:
+        """Count layer changes in an open G-code file, one chunk at a time.
+
+        OrcaSlicer marks layers with "; CHANGE_LAYER"; files without those
+        fall back to counting "; layer N" comments.
+        """
+        marker = b"; CHANGE_LAYER"
+        count = 0
+        carry = b""
+        f.seek(0)
+        while chunk := f.read(GCODE_SCAN_CHUNK_SIZE):
+            # Keep a marker split across two reads whole in the next buffer
+            buf = carry + chunk
+            count += buf.count(marker)
+            carry = buf[-(len(marker) - 1):]
+        if count:
+            return count
+
+        # Fallback pass, on whole lines so no comment straddles two buffers
+        count = 0
+        carry = b""
+        f.seek(0)
+        while chunk := f.read(GCODE_SCAN_CHUNK_SIZE):
+            buf, _, carry = (carry + chunk).rpartition(b"\n")
+            count += sum(1 for _ in _GCODE_LAYER_COMMENT_RE.finditer(buf))
+        count += sum(1 for _ in _GCODE_LAYER_COMMENT_RE.finditer(carry))
+        return count
+
+    def _parse_3mf_metadata(self, project_3mf: Path) -> Dict[str, Any]:
         """Parse filament metadata from 3MF file.
 
         The 3MF file is actually a zip archive containing:
         - Metadata/slice_info.config (XML with filament data)
+
+        Only that entry is read, straight from the archive.
         """
         metadata: Dict[str, Any] = {}
 
         try:
-            # Create a temporary directory for extraction
-            temp_extract_dir = output_dir / "temp_3mf_extract"
-            temp_extract_dir.mkdir(exist_ok=True)
-
-            # Extract the 3MF (which is actually a zip file)
             with zipfile.ZipFile(project_3mf, 'r') as zip_ref:
-                zip_ref.extractall(temp_extract_dir)
-
-            # Parse the slice_info.config XML file
-            slice_info_path = temp_extract_dir / "Metadata" / "slice_info.config"
-            if slice_info_path.exists():
-                with open(slice_info_path, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
-
-                # Parse XML
-                root = ET.fromstring(xml_content)
-
-                # Extract filament info from plate/filament element
-                plate = root.find("plate")
-                if plate is not None:
-                    filament = plate.find("filament")
-                    if filament is not None:
-                        # Extract filament usage in meters
-                        used_m = filament.attrib.get("used_m")
-                        if used_m:
-                            metadata["filament_used_mm"] = float(used_m) * 1000  # Convert to mm
-
-                        # Extract filament usage in grams
-                        used_g = filament.attrib.get("used_g")
-                        if used_g:
-                            metadata["filament_used_g"] = float(used_g)
-
-                        # Optionally extract filament type
-                        filament_type = filament.attrib.get("type")
-                        if filament_type:
-                            metadata["filament_type"] = filament_type
-
-                logger.debug(f"Extracted 3MF metadata: {metadata}")
-
-            # Cleanup temp directory
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
+                try:
+                    slice_info = zip_ref.open("Metadata/slice_info.config")
+                except KeyError:
+                    return metadata
+                with slice_info:
+                    filament = self._find_first_plate_filament(slice_info)
+
+            # Extract filament info from plate/filament element
+            if filament is not None:
+                # Extract filament usage in meters
+                used_m = filament.attrib.get("used_m")
+                if used_m:
+                    metadata["filament_used_mm"] = float(used_m) * 1000  # Convert to mm
+
+                # Extract filament usage in grams
+                used_g = filament.attrib.get("used_g")
+                if used_g:
+                    metadata["filament_used_g"] = float(used_g)
+
+                # Optionally extract filament type
+                filament_type = filament.attrib.get("type")
+                if filament_type:
+                    metadata["filament_type"] = filament_type
+
+            logger.debug("Extracted 3MF metadata: %s", metadata)
 
         except Exception as e:
             logger.error(f"Failed to parse 3MF metadata: {e}", exc_info=True)
-            # Cleanup on error
-            temp_extract_dir = output_dir / "temp_3mf_extract"
-            if temp_extract_dir.exists():
-                shutil.rmtree(temp_extract_dir, ignore_errors=True)
 
         return metadata
 
+    @staticmethod
+    def _find_first_plate_filament(xml_file: BinaryIO) -> Optional[ET.Element]:
+        """Return the first <filament> of the first top-level <plate>.
+
+        Parses incrementally and stops as soon as it is found (or the first
+        plate ends without one), instead of building the whole tree.
+        """
+        path = []
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "start":
+                path.append(elem.tag)
+                if path[1:] == ["plate", "filament"]:
+                    # Attributes are complete on the start event
+                    return elem
+                continue
+            path.pop()
+            if len(path) == 1 and elem.tag == "plate":
+                return None
+            elem.clear()
+        return None
+
     def _time_string_to_seconds(self, time_str: str) -> int:
         """Convert time string like '1h 16m 56s' to total seconds.
 
@@ -587,26 +1175,25 @@ class SliceService:
         Returns:
             Total time in seconds (rounded up)
         """
+        # One pass: digits accumulate until a unit letter claims them
         h = m = s = 0
+        num = 0
+        for ch in time_str:
+            if "0" <= ch <= "9":
+                num = num * 10 + ord(ch) - 48
+            elif ch == "h":
+                h = num
+                num = 0
+            elif ch == "m":
+                m = num
+                num = 0
+            elif ch == "s":
+                s = num
+                num = 0
+            else:
+                num = 0
 
-        # Extract hours
-        h_match = re.search(r'(\d+)h', time_str)
-        if h_match:
-            h = int(h_match.group(1))
-
-        # Extract minutes
-        m_match = re.search(r'(\d+)m', time_str)
-        if m_match:
-            m = int(m_match.group(1))
-
-        # Extract seconds
-        s_match = re.search(r'(\d+)s', time_str)
-        if s_match:
-            s = int(s_match.group(1))
-
-        # Calculate total seconds (round up if there are any seconds)
-        total_seconds = h * 3600 + m * 60 + s
-        return total_seconds
+        return h * 3600 + m * 60 + s
 
 
 slice_service = SliceService()
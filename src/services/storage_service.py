@@ -1,12 +1,55 @@
 """Storage service for file operations."""
 
+import concurrent.futures
+import functools
 import hashlib
+import io
+import mmap
+import os
+import queue
 import shutil
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 from ..core.config import settings
 
 
+# Read size for streaming uploads to disk; large chunks amortize syscalls
+CHUNK_SIZE = 1 << 20
+# Chunks read ahead of the writer thread; bounds memory per upload
+WRITE_QUEUE_DEPTH = 4
+# Largest single sendfile() call when copying an upload already on disk
+SENDFILE_MAX_BYTES = 1 << 30
+
+# Work directories are removed in the background, off the job's critical path
+_CLEANUP_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="cleanup"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _join_path(base: Path, *parts: str) -> Path:
+    """Join path components, reusing the result for repeated lookups."""
+    return base.joinpath(*parts)
+
+
+def _disk_fileno(file: BinaryIO) -> Optional[int]:
+    """Return the descriptor of an upload stored in a regular file, if it is.
+
+    Spooled uploads still held in memory return None; asking them for a
+    descriptor would first spill them to disk.
+    """
+    if isinstance(file, tempfile.SpooledTemporaryFile) and not getattr(file, "_rolled", True):
+        return None
+    try:
+        fd = file.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return fd if stat.S_ISREG(os.fstat(fd).st_mode) else None
+
+
 class StorageService:
     """Handle file storage operations."""
 
@@ -14,11 +57,18 @@ class StorageService:
         self.models_dir = settings.models_dir
         self.outputs_dir = settings.outputs_dir
         self.work_dir = settings.work_dir
+        self._pending_cleanups: set[concurrent.futures.Future] = set()
 
     def save_model(self, model_id: str, file: BinaryIO, filename: str) -> tuple[str, int, str]:
         """
         Save uploaded model file.
 
+        Streams the file to disk in CHUNK_SIZE pieces, hashing each chunk as
+        it is read so the data is only traversed once. Writes happen on a
+        second thread, so disk I/O overlaps with hashing (both release the
+        GIL). Uploads already spooled to disk are copied by the kernel
+        instead. Blocking; run it off the event loop.
+
         Returns: (storage_path, size_bytes, checksum_sha256)
         """
         model_dir = self.models_dir / model_id
@@ -26,21 +76,101 @@ class StorageService:
 
         file_path = model_dir / filename
 
-        # Calculate hash while saving
+        src_fd = _disk_fileno(file)
+        if src_fd is not None:
+            size_bytes, checksum = self._copy_from_fd(src_fd, file.tell(), file_path)
+            return str(file_path), size_bytes, checksum
+
         sha256_hash = hashlib.sha256()
-        size_bytes = 0
 
-        with open(file_path, "wb") as f:
-            while chunk := file.read(8192):
-                f.write(chunk)
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+        write_errors: list[BaseException] = []
+
+        def write_chunks():
+            try:
+                with open(file_path, "wb") as f:
+                    while (chunk := chunks.get()) is not None:
+                        f.write(chunk)
+            except BaseException as e:
+                write_errors.append(e)
+                # Keep consuming so the reader never blocks on a full queue
+                while chunks.get() is not None:
+                    pass
+
+        writer = threading.Thread(target=write_chunks, name=f"save-{model_id}")
+        writer.start()
+        try:
+            while chunk := file.read(CHUNK_SIZE):
+                chunks.put(chunk)
                 sha256_hash.update(chunk)
-                size_bytes += len(chunk)
+        finally:
+            chunks.put(None)
+            writer.join()
 
-        return str(file_path), size_bytes, sha256_hash.hexdigest()
+        if write_errors:
+            raise write_errors[0]
+
+        return str(file_path), file_path.stat().st_size, sha256_hash.hexdigest()
+
+    @staticmethod
+    def _copy_from_fd(src_fd: int, start: int, file_path: Path) -> tuple[int, str]:
+        """
+        Copy an upload that is already on disk, and hash it.
+
+        The kernel copies the data with sendfile() on a second thread while
+        this one hashes the source through a read-only mapping, so the bytes
+        never pass through Python objects.
+
+        Returns: (size_bytes, checksum_sha256)
+        """
+        end = os.fstat(src_fd).st_size
+        copy_errors: list[BaseException] = []
+
+        def copy():
+            try:
+                with open(file_path, "wb") as dst:
+                    if end > start and hasattr(os, "posix_fallocate"):
+                        # Reserve the whole file up front so the filesystem can
+                        # allocate contiguous extents instead of growing it
+                        # one write at a time
+                        try:
+                            os.posix_fallocate(dst.fileno(), 0, end - start)
+                        except OSError:
+                            pass
+                    offset = start
+                    while offset < end:
+                        sent = os.sendfile(
+                            dst.fileno(), src_fd, offset, min(end - offset, SENDFILE_MAX_BYTES)
+                        )
+                        if not sent:
+                            break
+                        offset += sent
+            except BaseException as e:
+                copy_errors.append(e)
+
+        copier = threading.Thread(target=copy, name=f"save-{file_path.parent.name}")
+        copier.start()
+        sha256_hash = hashlib.sha256()
+        try:
+            if end > start:
+                with mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        # Let the kernel read ahead aggressively for the
+                        # single front-to-back pass
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view, view[start:end] as data:
+                        sha256_hash.update(data)
+        finally:
+            copier.join()
+
+        if copy_errors:
+            raise copy_errors[0]
+
+        return max(end - start, 0), sha256_hash.hexdigest()
 
     def get_model_path(self, model_id: str) -> Path:
         """Get model directory path."""
-        return self.models_dir / model_id
+        return _join_path(self.models_dir, model_id)
 
     def get_job_output_dir(self, job_id: str) -> Path:
         """Get or create job output directory."""
@@ -55,14 +185,20 @@ class StorageService:
         return work_dir
 
     def cleanup_work_dir(self, job_id: str):
-        """Clean up job working directory."""
-        work_dir = self.work_dir / job_id
-        if work_dir.exists():
-            shutil.rmtree(work_dir)
+        """Schedule removal of a job working directory; does not block."""
+        future = _CLEANUP_EXECUTOR.submit(
+            shutil.rmtree, self.work_dir / job_id, ignore_errors=True
+        )
+        self._pending_cleanups.add(future)
+        future.add_done_callback(self._pending_cleanups.discard)
+
+    def close(self):
+        """Wait for scheduled cleanups to finish. Blocking."""
+        concurrent.futures.wait(list(self._pending_cleanups))
 
     def get_file_path(self, job_id: str, filename: str) -> Path:
         """Get output file path."""
-        return self.outputs_dir / job_id / filename
+        return _join_path(self.outputs_dir, job_id, filename)
 
 
 storage_service = StorageService()
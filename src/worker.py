@@ -0,0 +1,38 @@
+"""Standalone slice worker entry point.
+
+Runs the slice job dispatchers without the HTTP API, so slicing can be
+moved off the API processes and scaled separately:
+
+    RUN_SLICE_WORKERS=false uvicorn src.main:app ...
+    python -m src.worker
+"""
+
+import asyncio
+import signal
+from .core.logging import logger
+from .database import init_db
+from .services.slice_service import slice_service
+from .services.storage_service import storage_service
+
+
+async def run_worker():
+    """Process queued slice jobs until SIGINT or SIGTERM."""
+    await init_db()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Starting slice worker")
+    await slice_service.requeue_stale_jobs()
+    slice_service.start_dispatchers()
+    await stop.wait()
+
+    logger.info("Shutting down slice worker")
+    await slice_service.stop_dispatchers()
+    await asyncio.to_thread(storage_service.close)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
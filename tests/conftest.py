@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.main import app
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Test client sharing one application startup across the suite."""
+    with TestClient(app) as client:
+        yield client
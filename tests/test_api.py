@@ -4,26 +4,30 @@ Basic API tests.
 To run: pytest tests/
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from src.main import app
-
+import hashlib
+import shutil
+import tempfile
 
-client = TestClient(app)
+import pytest
+from starlette.formparsers import MultiPartParser
+from src.api.routes_slice_jobs import limit_polling
+from src.core.files import parse_range
+from src.core.ratelimit import TokenBucketLimiter, rate_limit
+from src.services.storage_service import storage_service
 
 
-def test_root():
+def test_root(api_client):
     """Test root endpoint."""
-    response = client.get("/")
+    response = api_client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["service"] == "OrcaSlicer API"
     assert "version" in data
 
 
-def test_health_check():
+def test_health_check(api_client):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = api_client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
@@ -32,9 +36,9 @@ def test_health_check():
     assert "uptime_seconds" in data
 
 
-def test_list_models_empty():
+def test_list_models_empty(api_client):
     """Test listing models when none exist."""
-    response = client.get("/models")
+    response = api_client.get("/models")
     assert response.status_code == 200
     data = response.json()
     assert "items" in data
@@ -42,9 +46,64 @@ def test_list_models_empty():
     assert isinstance(data["items"], list)
 
 
-def test_list_profiles():
+def test_upload_model(api_client):
+    """Test uploading a model stores it with size and checksum."""
+    content = b"solid test\n" + b"facet normal 0 0 0\n" * 100000 + b"endsolid test\n"
+
+    response = api_client.post("/models", files={"file": ("part.stl", content)})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["filename"] == "part.stl"
+    assert data["format"] == "stl"
+    assert data["size_bytes"] == len(content)
+    assert data["checksum_sha256"] == hashlib.sha256(content).hexdigest()
+
+
+def test_save_model_from_disk_file():
+    """Test saving an upload already spooled to disk copies and hashes it."""
+    content = b"solid disk\n" + b"facet normal 0 0 1\n" * 100000 + b"endsolid disk\n"
+
+    with tempfile.TemporaryFile() as upload:
+        upload.write(content)
+        upload.seek(0)
+        storage_path, size_bytes, checksum = storage_service.save_model(
+            "mdl_disktest", upload, "part.stl"
+        )
+
+    assert size_bytes == len(content)
+    assert checksum == hashlib.sha256(content).hexdigest()
+    with open(storage_path, "rb") as f:
+        assert f.read() == content
+    shutil.rmtree(storage_service.get_model_path("mdl_disktest"))
+
+
+def test_upload_spooled_in_memory_for_model_route_only(api_client, monkeypatch):
+    """Test that only model uploads get the larger in-memory upload buffer."""
+    spooled = []
+    save_model = storage_service.save_model
+
+    def spy(model_id, file, filename):
+        spooled.append(not file._rolled)
+        return save_model(model_id, file, filename)
+
+    monkeypatch.setattr(storage_service, "save_model", spy)
+    content = b"solid big\n" + b"facet normal 0 0 1\n" * 150000 + b"endsolid big\n"
+    response = api_client.post("/models", files={"file": ("big.stl", content)})
+    assert response.status_code == 201
+    assert spooled == [True]
+    assert MultiPartParser.max_file_size == 1024 * 1024
+
+
+def test_upload_unsupported_format(api_client):
+    """Test uploading a file with an unsupported extension."""
+    response = api_client.post("/models", files={"file": ("part.obj", b"v 0 0 0\n")})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "UNSUPPORTED_FORMAT"
+
+
+def test_list_profiles(api_client):
     """Test listing profiles."""
-    response = client.get("/profiles")
+    response = api_client.get("/profiles")
     assert response.status_code == 200
     data = response.json()
     assert "items" in data
@@ -52,7 +111,7 @@ def test_list_profiles():
     assert isinstance(data["items"], list)
 
 
-def test_create_profile():
+def test_create_profile(api_client):
     """Test creating a profile."""
     profile_data = {
         "name": "Test Profile",
@@ -68,30 +127,177 @@ def test_create_profile():
         }
     }
 
-    response = client.post("/profiles", json=profile_data)
+    response = api_client.post("/profiles", json=profile_data)
     assert response.status_code == 201
     data = response.json()
     assert data["name"] == profile_data["name"]
     assert data["source"] == "user"
     assert "id" in data
 
+    # Listings leave the overrides to the detail endpoint
+    listed = api_client.get("/profiles?limit=100").json()["items"]
+    assert "settings_overrides" not in next(p for p in listed if p["id"] == data["id"])
+    detail = api_client.get(f"/profiles/{data['id']}").json()
+    assert detail["settings_overrides"] == profile_data["settings_overrides"]
+
     # Cleanup
     profile_id = data["id"]
-    client.delete(f"/profiles/{profile_id}")
+    api_client.delete(f"/profiles/{profile_id}")
+
+
+def test_create_profiles_batch(api_client):
+    """Test creating several profiles in one request."""
+    names = [f"Batch Test {i}" for i in range(3)]
+    response = api_client.post(
+        "/profiles/batch",
+        json={"items": [{"name": name, "source": "user"} for name in names]},
+    )
+    assert response.status_code == 201
+    items = response.json()["items"]
+    assert [p["name"] for p in items] == names
+    assert len({p["id"] for p in items}) == 3
+
+    response = api_client.post("/profiles/batch", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_get_profile_conditional_request(api_client):
+    """Test that repeat profile reads with a matching ETag return 304."""
+    response = api_client.post("/profiles", json={"name": "ETag Profile"})
+    assert response.status_code == 201
+    profile_id = response.json()["id"]
+
+    response = api_client.get(f"/profiles/{profile_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = api_client.get(f"/profiles/{profile_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Cleanup
+    api_client.delete(f"/profiles/{profile_id}")
+
+
+def test_list_profiles_cursor_pagination(api_client):
+    """Test that following next_cursor visits every profile exactly once."""
+    for i in range(3):
+        api_client.post("/profiles", json={"name": f"Cursor Test {i}", "source": "user"})
+
+    expected = [p["id"] for p in api_client.get("/profiles?limit=100").json()["items"]]
+
+    seen = []
+    response = api_client.get("/profiles?limit=2")
+    while True:
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(p["id"] for p in data["items"])
+        if not data["next_cursor"]:
+            break
+        assert 'rel="next"' in response.headers["link"]
+        response = api_client.get("/profiles", params={"limit": 2, "cursor": data["next_cursor"]})
+
+    assert seen == expected
+
+
+def test_list_profiles_reflects_updates(api_client):
+    """Test that cached profile listings are dropped when a profile changes."""
+    created = api_client.post("/profiles", json={"name": "Cache Test", "source": "user"}).json()
+    listed = api_client.get("/profiles?limit=100").json()["items"]
+    assert created["id"] in [p["id"] for p in listed]
 
+    api_client.patch(f"/profiles/{created['id']}", json={"description": "changed"})
+    listed = api_client.get("/profiles?limit=100").json()["items"]
+    assert next(p for p in listed if p["id"] == created["id"])["description"] == "changed"
 
-def test_get_nonexistent_profile():
+    api_client.delete(f"/profiles/{created['id']}")
+    listed = api_client.get("/profiles?limit=100").json()["items"]
+    assert created["id"] not in [p["id"] for p in listed]
+
+
+def test_list_profiles_invalid_cursor(api_client):
+    """Test that a malformed cursor is rejected."""
+    response = api_client.get("/profiles?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_CURSOR"
+
+
+def test_get_nonexistent_profile(api_client):
     """Test getting a profile that doesn't exist."""
-    response = client.get("/profiles/nonexistent_id")
+    response = api_client.get("/profiles/nonexistent_id")
     assert response.status_code == 404
     data = response.json()
     assert "error" in data
     assert data["error"]["code"] == "PROFILE_NOT_FOUND"
 
 
-def test_error_response_format():
+def test_create_slice_job_unknown_model(api_client):
+    """Test that a slice job for an unknown model is rejected."""
+    response = api_client.post(
+        "/slice-jobs",
+        json={"model_id": "nonexistent_model", "profile_id": "nonexistent_profile"},
+    )
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "MODEL_NOT_FOUND"
+
+
+def test_stream_nonexistent_slice_job_events(api_client):
+    """Test that streaming events for an unknown job returns a 404."""
+    response = api_client.get("/slice-jobs/nonexistent_job/events")
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "SLICE_JOB_NOT_FOUND"
+
+
+def test_get_nonexistent_slice_job_status(api_client):
+    """Test that the light status endpoint returns a 404 for unknown jobs."""
+    response = api_client.get("/slice-jobs/nonexistent_job/status")
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "SLICE_JOB_NOT_FOUND"
+
+
+def test_slice_job_status_polling_rate_limited(api_client):
+    """Test that polling a job's status too fast returns 429 with Retry-After."""
+    api_client.app.dependency_overrides[limit_polling] = rate_limit(rate=1, burst=2)
+    try:
+        responses = [api_client.get("/slice-jobs/nonexistent_job/status") for _ in range(3)]
+    finally:
+        del api_client.app.dependency_overrides[limit_polling]
+
+    assert [r.status_code for r in responses] == [404, 404, 429]
+    assert responses[2].json()["error"]["code"] == "RATE_LIMITED"
+    assert int(responses[2].headers["retry-after"]) >= 1
+
+
+def test_head_nonexistent_slice_job_gcode(api_client):
+    """Test that probing G-code of an unknown job returns a 404."""
+    response = api_client.head("/slice-jobs/nonexistent_job/gcode")
+    assert response.status_code == 404
+
+
+def test_parse_range():
+    """Test byte-range parsing used by file downloads."""
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=0-5000", 1000) == (0, 999)
+    assert parse_range("bytes=0-1,5-6", 1000) is None
+    assert parse_range("items=0-1", 1000) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=1000-", 1000)
+
+
+def test_token_bucket_limiter():
+    """Test that the limiter allows a burst and then asks clients to wait."""
+    limiter = TokenBucketLimiter(rate=1, burst=2)
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") > 0
+    assert limiter.acquire("other") == 0
+
+
+def test_error_response_format(api_client):
     """Test that error responses follow the standard format."""
-    response = client.get("/profiles/invalid_id")
+    response = api_client.get("/profiles/invalid_id")
     assert response.status_code == 404
     data = response.json()
 
@@ -104,9 +310,9 @@ def test_error_response_format():
     assert error["http_status"] == 404
 
 
-def test_openapi_schema():
+def test_openapi_schema(api_client):
     """Test that OpenAPI schema is available."""
-    response = client.get("/openapi.json")
+    response = api_client.get("/openapi.json")
     assert response.status_code == 200
     schema = response.json()
     assert "openapi" in schema
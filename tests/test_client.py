@@ -5,14 +5,16 @@ These tests require a running API instance.
 To run: pytest tests/test_client.py --api-url http://localhost:8000
 """
 
+import asyncio
 import pytest
-from src.clients.python_client import OrcaSlicerClient, ApiError
+from src.clients.python_client import OrcaSlicerClient, AsyncOrcaSlicerClient, ApiError
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
-    return OrcaSlicerClient(base_url="http://localhost:8000")
+    """Create a test client whose connection pool is shared by all tests."""
+    with OrcaSlicerClient(base_url="http://localhost:8000") as client:
+        yield client
 
 
 def test_client_initialization():
@@ -68,3 +70,14 @@ def test_api_error_handling(client):
     assert error.status_code == 404
     assert error.error_code == "PROFILE_NOT_FOUND"
     assert "nonexistent_profile_id" in error.message
+
+
+def test_async_client_error_handling():
+    """Test that the async client raises the same API errors."""
+    async def fetch_missing_profile():
+        async with AsyncOrcaSlicerClient(base_url="http://localhost:8000") as client:
+            await client.get_profile("nonexistent_profile_id")
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(fetch_missing_profile())
+    assert exc_info.value.error_code == "PROFILE_NOT_FOUND"